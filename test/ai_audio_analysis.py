@@ -267,6 +267,7 @@ class AIAnalysisResult:
 # Global CLAP model (loaded once, thread-safe)
 _clap_model = None
 _clap_processor = None
+_clap_text_embeds = None  # normalized descriptor embeddings, computed once
 _clap_lock = threading.Lock()
 
 
@@ -383,6 +384,70 @@ def load_clap_model(verbose: bool = True):
             return None, None
 
 
+def _get_clap_text_embeds(model, processor):
+    """Normalized text embeddings for every CLAP descriptor.
+
+    The descriptor set is fixed, so it is encoded once per process and
+    reused for every clip. Call with _clap_lock held.
+    """
+    global _clap_text_embeds
+
+    if _clap_text_embeds is None:
+        all_texts = CLAP_POSITIVE_DESCRIPTORS + CLAP_NEGATIVE_DESCRIPTORS + list(CLAP_CHARACTER_DESCRIPTORS.values())
+        text_inputs = processor(text=all_texts, return_tensors="pt", padding=True)
+
+        if torch.cuda.is_available():
+            text_inputs = {k: v.cuda() for k, v in text_inputs.items()}
+
+        with torch.no_grad():
+            text_embeds = model.get_text_features(**text_inputs)
+            _clap_text_embeds = text_embeds / text_embeds.norm(dim=-1, keepdim=True)
+
+    return _clap_text_embeds
+
+
+def _scores_from_similarities(similarities: np.ndarray) -> CLAPScores:
+    """Turn one audio clip's similarities to all descriptors into scores.
+
+    similarities is ordered positive, negative, then character descriptors.
+    """
+    n_pos = len(CLAP_POSITIVE_DESCRIPTORS)
+    n_neg = len(CLAP_NEGATIVE_DESCRIPTORS)
+
+    pos_sims = similarities[:n_pos]
+    neg_sims = similarities[n_pos:n_pos + n_neg]
+    char_sims = similarities[n_pos + n_neg:]
+
+    # Compute scores
+    positive_score = float(np.mean(pos_sims))
+    negative_score = float(np.mean(neg_sims))
+
+    # Quality score: positive - negative, scaled to 0-100
+    raw_quality = positive_score - negative_score
+    quality_score = float(np.clip((raw_quality + 0.3) / 0.6 * 100, 0, 100))
+
+    # Character scores
+    character_scores = {}
+    char_names = list(CLAP_CHARACTER_DESCRIPTORS.keys())
+    for i, name in enumerate(char_names):
+        character_scores[name] = float(char_sims[i])
+
+    # Top matches
+    pos_sorted = sorted(zip(CLAP_POSITIVE_DESCRIPTORS, pos_sims),
+                       key=lambda x: x[1], reverse=True)
+    neg_sorted = sorted(zip(CLAP_NEGATIVE_DESCRIPTORS, neg_sims),
+                       key=lambda x: x[1], reverse=True)
+
+    return CLAPScores(
+        positive_score=positive_score,
+        negative_score=negative_score,
+        quality_score=quality_score,
+        character_scores=character_scores,
+        top_positive=[(d, float(s)) for d, s in pos_sorted[:3]],
+        top_negative=[(d, float(s)) for d, s in neg_sorted[:3]]
+    )
+
+
 def analyze_with_clap(audio_path: Path, verbose: bool = True) -> CLAPScores | None:
     """Analyze audio using CLAP embeddings (thread-safe)."""
     model, processor = load_clap_model(verbose=verbose)
@@ -414,61 +479,14 @@ def analyze_with_clap(audio_path: Path, verbose: bool = True) -> CLAPScores | No
                 audio_embed = model.get_audio_features(**audio_inputs)
                 audio_embed = audio_embed / audio_embed.norm(dim=-1, keepdim=True)
 
-            # Get text embeddings for all descriptors
-            all_texts = CLAP_POSITIVE_DESCRIPTORS + CLAP_NEGATIVE_DESCRIPTORS + list(CLAP_CHARACTER_DESCRIPTORS.values())
-
-            text_inputs = processor(
-                text=all_texts,
-                return_tensors="pt",
-                padding=True
-            )
-
-            if torch.cuda.is_available():
-                text_inputs = {k: v.cuda() for k, v in text_inputs.items()}
-
-            with torch.no_grad():
-                text_embeds = model.get_text_features(**text_inputs)
-                text_embeds = text_embeds / text_embeds.norm(dim=-1, keepdim=True)
+            # Text embeddings for all descriptors (encoded on first use)
+            text_embeds = _get_clap_text_embeds(model, processor)
 
             # Compute similarities
             similarities = (audio_embed @ text_embeds.T).squeeze().cpu().numpy()
 
         # Rest of processing can be done outside lock
-        n_pos = len(CLAP_POSITIVE_DESCRIPTORS)
-        n_neg = len(CLAP_NEGATIVE_DESCRIPTORS)
-
-        pos_sims = similarities[:n_pos]
-        neg_sims = similarities[n_pos:n_pos + n_neg]
-        char_sims = similarities[n_pos + n_neg:]
-
-        # Compute scores
-        positive_score = float(np.mean(pos_sims))
-        negative_score = float(np.mean(neg_sims))
-
-        # Quality score: positive - negative, scaled to 0-100
-        raw_quality = positive_score - negative_score
-        quality_score = float(np.clip((raw_quality + 0.3) / 0.6 * 100, 0, 100))
-
-        # Character scores
-        character_scores = {}
-        char_names = list(CLAP_CHARACTER_DESCRIPTORS.keys())
-        for i, name in enumerate(char_names):
-            character_scores[name] = float(char_sims[i])
-
-        # Top matches
-        pos_sorted = sorted(zip(CLAP_POSITIVE_DESCRIPTORS, pos_sims),
-                           key=lambda x: x[1], reverse=True)
-        neg_sorted = sorted(zip(CLAP_NEGATIVE_DESCRIPTORS, neg_sims),
-                           key=lambda x: x[1], reverse=True)
-
-        return CLAPScores(
-            positive_score=positive_score,
-            negative_score=negative_score,
-            quality_score=quality_score,
-            character_scores=character_scores,
-            top_positive=[(d, float(s)) for d, s in pos_sorted[:3]],
-            top_negative=[(d, float(s)) for d, s in neg_sorted[:3]]
-        )
+        return _scores_from_similarities(similarities)
 
     except Exception as e:
         print(f"  Warning: CLAP analysis failed: {e}")
@@ -523,16 +541,9 @@ def analyze_with_clap_batch(audio_paths: list[Path], batch_size: int = 8) -> lis
     # Process in batches under the lock
     try:
         with _clap_lock:
-            # Get text embeddings once (shared across all batches)
-            all_texts = CLAP_POSITIVE_DESCRIPTORS + CLAP_NEGATIVE_DESCRIPTORS + list(CLAP_CHARACTER_DESCRIPTORS.values())
-            text_inputs = processor(text=all_texts, return_tensors="pt", padding=True)
-
-            if torch.cuda.is_available():
-                text_inputs = {k: v.cuda() for k, v in text_inputs.items()}
-
-            with torch.no_grad():
-                text_embeds = model.get_text_features(**text_inputs)
-                text_embeds = text_embeds / text_embeds.norm(dim=-1, keepdim=True)
+            # Text embeddings for all descriptors (shared across batches
+            # and calls)
+            text_embeds = _get_clap_text_embeds(model, processor)
 
             # Process audio in batches
             indices = list(audio_data.keys())
@@ -554,42 +565,11 @@ def analyze_with_clap_batch(audio_paths: list[Path], batch_size: int = 8) -> lis
                     audio_embeds = model.get_audio_features(**audio_inputs)
                     audio_embeds = audio_embeds / audio_embeds.norm(dim=-1, keepdim=True)
 
-                # Compute similarities for each audio in batch
+                # Similarities for the whole batch in one matmul and a
+                # single device-to-host copy
+                batch_sims = (audio_embeds @ text_embeds.T).cpu().numpy()
                 for batch_idx, orig_idx in enumerate(batch_indices):
-                    audio_embed = audio_embeds[batch_idx:batch_idx+1]
-                    similarities = (audio_embed @ text_embeds.T).squeeze().cpu().numpy()
-
-                    # Compute scores
-                    n_pos = len(CLAP_POSITIVE_DESCRIPTORS)
-                    n_neg = len(CLAP_NEGATIVE_DESCRIPTORS)
-
-                    pos_sims = similarities[:n_pos]
-                    neg_sims = similarities[n_pos:n_pos + n_neg]
-                    char_sims = similarities[n_pos + n_neg:]
-
-                    positive_score = float(np.mean(pos_sims))
-                    negative_score = float(np.mean(neg_sims))
-                    raw_quality = positive_score - negative_score
-                    quality_score = float(np.clip((raw_quality + 0.3) / 0.6 * 100, 0, 100))
-
-                    character_scores = {}
-                    char_names = list(CLAP_CHARACTER_DESCRIPTORS.keys())
-                    for i, name in enumerate(char_names):
-                        character_scores[name] = float(char_sims[i])
-
-                    pos_sorted = sorted(zip(CLAP_POSITIVE_DESCRIPTORS, pos_sims),
-                                       key=lambda x: x[1], reverse=True)
-                    neg_sorted = sorted(zip(CLAP_NEGATIVE_DESCRIPTORS, neg_sims),
-                                       key=lambda x: x[1], reverse=True)
-
-                    results[orig_idx] = CLAPScores(
-                        positive_score=positive_score,
-                        negative_score=negative_score,
-                        quality_score=quality_score,
-                        character_scores=character_scores,
-                        top_positive=[(d, float(s)) for d, s in pos_sorted[:3]],
-                        top_negative=[(d, float(s)) for d, s in neg_sorted[:3]]
-                    )
+                    results[orig_idx] = _scores_from_similarities(batch_sims[batch_idx])
 
     except Exception as e:
         print(f"  Warning: CLAP batch analysis failed: {e}")
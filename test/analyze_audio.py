@@ -39,6 +39,7 @@ def generate_spectrogram(
     use_mel: bool = True,
     n_fft: int = 2048,
     hop_length: int = 512,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Generate a spectrogram from audio data.
@@ -53,6 +54,7 @@ def generate_spectrogram(
         use_mel: Use mel spectrogram (True) or linear (False)
         n_fft: FFT window size
         hop_length: Hop length for STFT
+        fig: Figure to draw on (cleared first); a new one is created if None
 
     Returns:
         matplotlib Figure object
@@ -75,8 +77,13 @@ def generate_spectrogram(
         S_db = librosa.amplitude_to_db(S, ref=np.max)
         ylabel = "Frequency (Hz)"
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=figsize)
+    # Create figure (or recycle the caller's)
+    if fig is None:
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+        ax = fig.add_subplot()
 
     if use_mel:
         img = librosa.display.specshow(
@@ -93,7 +100,7 @@ def generate_spectrogram(
     if title:
         ax.set_title(title)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if output_path:
         fig.savefig(output_path, dpi=150, bbox_inches="tight")
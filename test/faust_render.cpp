@@ -8,6 +8,7 @@
  *   ./faust_render --module TheAbyss --output test.wav --duration 2.0 \
  *       --param decay=0.8 --param pressure=0.6
  *   ./faust_render --module LadderLPF --list-params
+ *   ./faust_render --module TheAbyss --batch jobs.json --duration 2.0
  */
 
 #include "AbstractDSP.hpp"
@@ -630,6 +631,7 @@ void printUsage(const char* programName) {
               << "  --duration SECS     Duration in seconds (default: 2.0)\n"
               << "  --sample-rate RATE  Sample rate (default: 48000)\n"
               << "  --param NAME=VALUE  Set parameter value (can repeat)\n"
+              << "  --batch FILE        Render a JSON list of {\"output\", \"params\"} jobs\n"
               << "  --scenario NAME     Use a pre-defined test scenario\n"
               << "  --showcase          Render showcase audio with multiple notes and automations\n"
               << "  --showcase-config   Custom config file for showcase (overrides test_config.json)\n"
@@ -652,6 +654,7 @@ struct Options {
     std::string outputFile = "output.wav";
     std::string scenario;  // Named scenario from test_config.json
     std::string showcaseConfigFile;  // Override config file for showcase
+    std::string batchFile;  // JSON list of {"output", "params"} render jobs
     float duration = 2.0f;
     int sampleRate = 48000;
     std::map<std::string, float> params;
@@ -699,6 +702,10 @@ bool parseArgs(int argc, char** argv, Options& opts) {
             opts.showcaseConfigFile = argv[++i];
             continue;
         }
+        if (arg == "--batch" && i + 1 < argc) {
+            opts.batchFile = argv[++i];
+            continue;
+        }
         if (arg == "--scenario" && i + 1 < argc) {
             opts.scenario = argv[++i];
             continue;
@@ -736,6 +743,86 @@ bool parseArgs(int argc, char** argv, Options& opts) {
     return true;
 }
 
+// ============================================================================
+// Batch Rendering
+// ============================================================================
+
+struct BatchJob {
+    std::string outputFile;
+    std::map<std::string, float> params;
+};
+
+bool loadBatchFile(const std::string& path, std::vector<BatchJob>& jobs) {
+    JsonValue json = load_json_file(path);
+    if (!json.is_array()) {
+        return false;
+    }
+    for (const auto& job_json : json.array_val) {
+        BatchJob job;
+        job.outputFile = job_json["output"].get_string();
+        if (job.outputFile.empty()) {
+            return false;
+        }
+        if (job_json["params"].is_object()) {
+            for (const auto& kv : job_json["params"].object_val) {
+                job.params[kv.first] = static_cast<float>(kv.second.get_number());
+            }
+        }
+        jobs.push_back(job);
+    }
+    return true;
+}
+
+// Render every job in the batch file with one DSP instance, re-initialized
+// (state cleared, controls back to defaults) before each job, so the process
+// start-up and DSP construction are paid once per batch. Prints (and flushes)
+// "OK <index>" or "FAIL <index>" as each job finishes, so callers can process
+// a WAV while the next renders; exits non-zero only if the batch file is
+// unusable.
+int renderBatch(AbstractDSP& dsp, const Options& opts, const ModuleTestConfig& config,
+                const TestScenario* scenario) {
+    std::vector<BatchJob> jobs;
+    if (!loadBatchFile(opts.batchFile, jobs)) {
+        std::cerr << "Error: Cannot read batch file: " << opts.batchFile << "\n";
+        return 1;
+    }
+
+    int numChannels = dsp.getNumOutputs();
+    size_t failed = 0;
+    for (size_t j = 0; j < jobs.size(); j++) {
+        dsp.init(opts.sampleRate);
+
+        if (scenario) {
+            for (const auto& kv : scenario->parameters) {
+                int idx = dsp.getParamIndex(kv.first.c_str());
+                if (idx >= 0) {
+                    dsp.setParamValue(idx, kv.second);
+                }
+            }
+        }
+        for (const auto& kv : jobs[j].params) {
+            int idx = dsp.getParamIndex(kv.first.c_str());
+            if (idx >= 0) {
+                dsp.setParamValue(idx, kv.second);
+            } else {
+                std::cerr << "Warning: Unknown parameter: " << kv.first << "\n";
+            }
+        }
+
+        std::vector<float> samples = renderAudio(dsp, opts.sampleRate, opts.duration,
+                                                 config.module_type, opts.noAutoGate, scenario);
+        if (writeWav(jobs[j].outputFile, samples, opts.sampleRate, numChannels)) {
+            std::cout << "OK " << j << std::endl;
+        } else {
+            std::cout << "FAIL " << j << std::endl;
+            failed++;
+        }
+    }
+
+    std::cout << "Rendered " << jobs.size() - failed << "/" << jobs.size() << " jobs\n";
+    return 0;
+}
+
 // ============================================================================
 // Main
 // ============================================================================
@@ -843,6 +930,10 @@ int main(int argc, char** argv) {
         }
     }
 
+    if (!opts.batchFile.empty()) {
+        return renderBatch(*dsp, opts, config, scenario);
+    }
+
     // Apply scenario parameters first
     if (scenario) {
         for (const auto& kv : scenario->parameters) {
@@ -15,6 +15,7 @@ import argparse
 import html
 import itertools
 import json
+import math
 import os
 import re
 import subprocess
@@ -437,7 +438,7 @@ def analyze_quality(audio: np.ndarray) -> QualityMetrics:
     if not HAS_SCIPY:
         # Basic metrics without scipy
         metrics.peak_amplitude = float(np.max(np.abs(audio)))
-        metrics.rms_level = float(np.sqrt(np.mean(audio ** 2)))
+        metrics.rms_level = math.sqrt(float(np.dot(audio, audio)) / len(audio))
         metrics.dc_offset = float(np.mean(audio))
         clip_count = np.sum(np.abs(audio) >= 0.99)
         metrics.clipping_percent = float(100.0 * clip_count / len(audio))
@@ -447,7 +448,8 @@ def analyze_quality(audio: np.ndarray) -> QualityMetrics:
 
     # Peak and RMS
     metrics.peak_amplitude = float(np.max(np.abs(audio)))
-    metrics.rms_level = float(np.sqrt(np.mean(audio ** 2)))
+    # Sum of squares via BLAS dot: no audio**2 temporary
+    metrics.rms_level = math.sqrt(float(np.dot(audio, audio)) / len(audio))
 
     # DC offset
     metrics.dc_offset = float(np.mean(audio))
@@ -27,6 +27,7 @@ Usage:
     python generate_showcase_report.py              # All modules
     python generate_showcase_report.py --module ChaosFlute
     python generate_showcase_report.py --skip-ai    # Skip AI analysis
+    python generate_showcase_report.py --inline-assets  # Self-contained HTML
 """
 
 import warnings
@@ -37,17 +38,22 @@ warnings.warn(
 )
 
 import argparse
+import asyncio
 import base64
-import html
+import functools
 import json
+import mmap
 import os
+import string
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import numpy as np
 
@@ -65,27 +71,55 @@ def load_dotenv():
 
 load_dotenv()
 
-# Optional dependencies
+# Optional dependencies (probed here, imported on first use to keep startup fast)
+HAS_SCIPY = find_spec("scipy") is not None
+HAS_LIBROSA = find_spec("librosa") is not None
+HAS_MATPLOTLIB = find_spec("matplotlib") is not None
+
+
 try:
-    from scipy.io import wavfile
-    from scipy import signal
-    HAS_SCIPY = True
+    # SIMD base64 codec; returns str directly, skipping the bytes -> str copy
+    from pybase64 import b64encode_as_string as _b64encode_str
 except ImportError:
-    HAS_SCIPY = False
+    def _b64encode_str(data) -> str:
+        return base64.b64encode(data).decode('ascii')
+
 
 try:
-    import librosa
-    HAS_LIBROSA = True
+    import orjson
+
+    def _dump_json(obj, path: Path) -> None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 except ImportError:
-    HAS_LIBROSA = False
+    def _dump_json(obj, path: Path) -> None:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
 
-try:
+
+@functools.cache
+def _signal():
+    from scipy import signal
+    return signal
+
+
+@functools.cache
+def _wavfile():
+    from scipy.io import wavfile
+    return wavfile
+
+
+@functools.cache
+def _librosa():
+    import librosa
+    return librosa
+
+
+@functools.cache
+def _plt():
     import matplotlib
     matplotlib.use('Agg')
     import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+    return plt
 
 
 # Configuration
@@ -204,8 +238,12 @@ def get_render_executable() -> Path:
     return exe
 
 
+@functools.lru_cache(maxsize=None)
 def load_module_config(module_name: str) -> dict:
-    """Load test configuration for a module."""
+    """Load test configuration for a module.
+
+    Cached per module; callers that modify the result must copy it first.
+    """
     project_root = get_project_root()
     config_path = project_root / "src" / "modules" / module_name / "test_config.json"
 
@@ -289,11 +327,12 @@ def get_default_showcase_config(module_type: str) -> ShowcaseConfig:
     return showcase
 
 
-def get_available_modules() -> list[str]:
+@functools.lru_cache(maxsize=1)
+def get_available_modules() -> tuple[str, ...]:
     """Get list of available modules from faust_render."""
     exe = get_render_executable()
     if not exe.exists():
-        return []
+        return ()
 
     try:
         result = subprocess.run(
@@ -305,9 +344,9 @@ def get_available_modules() -> list[str]:
             line = line.strip()
             if line and not line.startswith("Available"):
                 modules.append(line)
-        return modules
+        return tuple(modules)
     except Exception:
-        return []
+        return ()
 
 
 def get_panel_svg(module_name: str) -> Path | None:
@@ -483,13 +522,7 @@ def render_showcase(module_name: str, output_path: Path, verbose: bool = False)
         print(f"Error: faust_render not found at {exe}")
         return False
 
-    args = [
-        str(exe),
-        "--module", module_name,
-        "--showcase",
-        "--output", str(output_path),
-        "--sample-rate", str(SAMPLE_RATE),
-    ]
+    args = get_showcase_render_args(exe, module_name, output_path)
 
     try:
         result = subprocess.run(args, capture_output=True, text=True, timeout=120)
@@ -507,16 +540,15 @@ def render_showcase(module_name: str, output_path: Path, verbose: bool = False)
         return False
 
 
-def render_showcase_with_config(module_name: str, output_path: Path,
-                                 showcase: ShowcaseConfig, verbose: bool = False) -> bool:
-    """Render showcase audio using a custom ShowcaseConfig.
+def write_showcase_config(module_name: str, showcase: ShowcaseConfig) -> str:
+    """Write module config with the given showcase to a temp file for faust_render.
 
-    Writes a temporary config file for faust_render to use.
+    Returns the temp file path; the caller is responsible for deleting it.
     """
     import tempfile
 
-    # Create temp config file with showcase config
-    config = load_module_config(module_name)
+    # Copy: the config loader is cached
+    config = dict(load_module_config(module_name))
 
     # Convert ShowcaseConfig to dict format expected by faust_render
     config["showcase"] = {
@@ -532,24 +564,35 @@ def render_showcase_with_config(module_name: str, output_path: Path,
         ]
     }
 
-    # Write to temp file
     with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
         json.dump(config, f)
-        temp_config_path = f.name
+        return f.name
+
+
+def get_showcase_render_args(exe: Path, module_name: str, output_path: Path,
+                             config_path: str | None = None) -> list[str]:
+    """Build the faust_render command line for a showcase render."""
+    args = [str(exe), "--module", module_name, "--showcase"]
+    if config_path:
+        args += ["--showcase-config", config_path]
+    args += ["--output", str(output_path), "--sample-rate", str(SAMPLE_RATE)]
+    return args
+
+
+def render_showcase_with_config(module_name: str, output_path: Path,
+                                 showcase: ShowcaseConfig, verbose: bool = False) -> bool:
+    """Render showcase audio using a custom ShowcaseConfig.
+
+    Writes a temporary config file for faust_render to use.
+    """
+    temp_config_path = write_showcase_config(module_name, showcase)
 
     try:
         exe = get_render_executable()
         if not exe.exists():
             return False
 
-        args = [
-            str(exe),
-            "--module", module_name,
-            "--showcase",
-            "--showcase-config", temp_config_path,
-            "--output", str(output_path),
-            "--sample-rate", str(SAMPLE_RATE),
-        ]
+        args = get_showcase_render_args(exe, module_name, output_path, temp_config_path)
 
         result = subprocess.run(args, capture_output=True, text=True, timeout=180)
         if verbose:
@@ -566,6 +609,76 @@ def render_showcase_with_config(module_name: str, output_path: Path,
         Path(temp_config_path).unlink(missing_ok=True)
 
 
+async def render_showcase_async(module_name: str, output_path: Path,
+                                showcase: ShowcaseConfig | None = None,
+                                verbose: bool = False) -> bool:
+    """Render showcase audio without blocking the event loop.
+
+    Uses the module's own showcase unless a custom ShowcaseConfig is given.
+    """
+    exe = get_render_executable()
+    if not exe.exists():
+        print(f"Error: faust_render not found at {exe}")
+        return False
+
+    temp_config_path = write_showcase_config(module_name, showcase) if showcase else None
+    timeout = 180 if showcase else 120
+
+    try:
+        args = get_showcase_render_args(exe, module_name, output_path, temp_config_path)
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE if verbose else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            print(f"Timeout rendering {module_name}")
+            return False
+
+        if verbose and stdout:
+            print(stdout.decode(errors="replace"))
+        if proc.returncode != 0:
+            print(f"Error rendering {module_name}: {stderr.decode(errors='replace')}")
+            return False
+        return True
+    except Exception as e:
+        print(f"Error rendering {module_name}: {e}")
+        return False
+    finally:
+        if temp_config_path:
+            Path(temp_config_path).unlink(missing_ok=True)
+
+
+async def render_all_showcases(modules: list[str], output_dir: Path,
+                               systematic_configs: dict[str, ShowcaseConfig],
+                               parallel: int, verbose: bool = False) -> dict[str, Path]:
+    """Render showcase audio for all modules, at most `parallel` at a time.
+
+    Returns a dict of module name -> WAV path for successful renders.
+    """
+    semaphore = asyncio.Semaphore(parallel)
+    wav_paths = {}
+
+    async def render_one(module: str) -> None:
+        wav_path = output_dir / f"{module}_showcase.wav"
+        async with semaphore:
+            success = await render_showcase_async(
+                module, wav_path, systematic_configs.get(module), verbose
+            )
+        if success:
+            wav_paths[module] = wav_path
+            print(f"  ✓ {module}")
+        else:
+            print(f"  ✗ {module} (render failed)")
+
+    await asyncio.gather(*(render_one(m) for m in modules))
+    return wav_paths
+
+
 @dataclass
 class ModuleParam:
     """Module parameter information."""
@@ -575,11 +688,15 @@ class ModuleParam:
     init_val: float
 
 
-def get_module_params(module_name: str) -> list[ModuleParam]:
-    """Get all parameters for a module from faust_render."""
+@functools.lru_cache(maxsize=None)
+def get_module_params(module_name: str) -> tuple[ModuleParam, ...]:
+    """Get all parameters for a module from faust_render.
+
+    Cached per module, so the result is an immutable tuple.
+    """
     exe = get_render_executable()
     if not exe.exists():
-        return []
+        return ()
 
     try:
         result = subprocess.run(
@@ -598,23 +715,23 @@ def get_module_params(module_name: str) -> list[ModuleParam]:
                     max_val=float(match.group(3)),
                     init_val=float(match.group(4))
                 ))
-        return params
+        return tuple(params)
     except Exception:
-        return []
+        return ()
 
 
 def load_audio(path: Path) -> np.ndarray | None:
     """Load audio file as numpy array."""
     if HAS_LIBROSA:
         try:
-            y, sr = librosa.load(str(path), sr=SAMPLE_RATE, mono=True)
+            y, sr = _librosa().load(str(path), sr=SAMPLE_RATE, mono=True)
             return y
         except Exception:
             pass
 
     if HAS_SCIPY:
         try:
-            sr, data = wavfile.read(str(path))
+            sr, data = _wavfile().read(str(path))
             if data.dtype == np.int16:
                 data = data.astype(np.float32) / 32768.0
             if data.ndim > 1:
@@ -637,21 +754,21 @@ def analyze_quality(audio: np.ndarray) -> QualityMetrics:
     if len(audio) == 0:
         return metrics
 
-    # Peak and RMS
-    metrics.peak_amplitude = float(np.max(np.abs(audio)))
-    metrics.rms_level = float(np.sqrt(np.mean(audio ** 2)))
+    # Peak, RMS, DC offset and clipping (>= 0.99) in one pass over the buffer
+    # (utils pulls in librosa, so it is only imported once analysis starts)
+    from utils import fused_audio_stats
 
-    # DC offset
-    metrics.dc_offset = float(np.mean(audio))
-
-    # Clipping detection (>= 0.99)
-    clip_count = np.sum(np.abs(audio) >= 0.99)
-    metrics.clipping_percent = float(100.0 * clip_count / len(audio))
+    n = len(audio)
+    total, ssq, peak, clip_count = fused_audio_stats(np.ascontiguousarray(audio))
+    metrics.peak_amplitude = float(peak)
+    metrics.rms_level = float(np.sqrt(ssq / n))
+    metrics.dc_offset = float(total / n)
+    metrics.clipping_percent = float(100.0 * clip_count / n)
 
     # THD estimation (simplified - based on spectral analysis)
     if HAS_SCIPY:
         try:
-            freqs, psd = signal.welch(audio, fs=SAMPLE_RATE, nperseg=4096)
+            freqs, psd = _signal().welch(audio, fs=SAMPLE_RATE, nperseg=4096)
             if np.max(psd) > 0:
                 # Find fundamental peak
                 peak_idx = np.argmax(psd)
@@ -673,7 +790,7 @@ def analyze_quality(audio: np.ndarray) -> QualityMetrics:
     if HAS_SCIPY and metrics.rms_level > 0.01:
         try:
             # Use autocorrelation-based approach
-            corr = signal.correlate(audio[:SAMPLE_RATE], audio[:SAMPLE_RATE], mode='full')
+            corr = _signal().correlate(audio[:SAMPLE_RATE], audio[:SAMPLE_RATE], mode='full')
             corr = corr[len(corr)//2:]
             peak_idx = np.argmax(corr[100:]) + 100  # Skip DC area
             if peak_idx > 0 and corr[0] > 0:
@@ -686,20 +803,83 @@ def analyze_quality(audio: np.ndarray) -> QualityMetrics:
     return metrics
 
 
+def get_quality_limits(config: dict) -> tuple[float, float]:
+    """Get (thd_max_percent, clipping_max_percent) for a module config."""
+    thresholds = config.get("quality_thresholds", {})
+    thd_max = thresholds.get("thd_max_percent", 15.0)
+    clipping_max = thresholds.get("clipping_max_percent", 1.0)
+    if thresholds.get("allow_hot_signal", False):
+        clipping_max = 15.0  # More lenient for hot signal modules
+    return thd_max, clipping_max
+
+
+def apply_quality_thresholds(reports: list[ModuleReport]) -> None:
+    """Set issues and pass/needs_work status for analyzed reports.
+
+    Only reports still "pending" are checked. All their metrics are compared
+    against per-module limits in a single vectorized pass.
+    """
+    pending = [r for r in reports if r.status == "pending"]
+    if not pending:
+        return
+
+    # Columns: THD, clipping, low peak, DC offset. Peak is negated so that
+    # every check is "metric > limit".
+    module_limits = [get_quality_limits(load_module_config(r.module_name)) for r in pending]
+    limits = np.array([(thd_max, clipping_max, -0.1, 0.1)
+                       for thd_max, clipping_max in module_limits])
+    metrics = np.array([
+        (r.quality.thd_percent, r.quality.clipping_percent,
+         -r.quality.peak_amplitude, abs(r.quality.dc_offset))
+        for r in pending
+    ])
+    exceeded = metrics > limits
+
+    for r, (thd_bad, clip_bad, low_bad, dc_bad), (thd_max, clipping_max) in zip(
+            pending, exceeded.tolist(), module_limits):
+        issues = []
+        if thd_bad:
+            issues.append(f"THD {r.quality.thd_percent:.1f}% exceeds threshold {thd_max}%")
+        if clip_bad:
+            issues.append(f"Clipping {r.quality.clipping_percent:.1f}% exceeds threshold {clipping_max}%")
+        if low_bad:
+            issues.append("Very low output level (peak < 0.1)")
+        if dc_bad:
+            issues.append(f"Significant DC offset: {r.quality.dc_offset:.3f}")
+        r.issues = issues
+        r.status = "pass" if not issues else "needs_work"
+
+
 # =============================================================================
 # Spectrogram Generation
 # =============================================================================
 
-def generate_spectrogram(audio: np.ndarray, output_path: Path, title: str = "") -> bool:
-    """Generate spectrogram image."""
+def _prepare_figure(fig, figsize: tuple[float, float]):
+    """Get a blank (fig, ax) of the given size: a new figure, or fig recycled."""
+    if fig is None:
+        return _plt().subplots(figsize=figsize)
+    fig.clf()
+    fig.set_size_inches(figsize)
+    fig.patch.set_facecolor(_plt().rcParams['figure.facecolor'])
+    return fig, fig.add_subplot()
+
+
+def generate_spectrogram(audio: np.ndarray, output_path: Path, title: str = "",
+                         fig=None) -> bool:
+    """Generate spectrogram image.
+
+    Draws on fig (cleared first) when given, otherwise on a new figure.
+    """
     if not HAS_MATPLOTLIB or not HAS_SCIPY:
         return False
 
     try:
-        fig, ax = plt.subplots(figsize=(12, 4))
+        plt = _plt()
+        owns_fig = fig is None
+        fig, ax = _prepare_figure(fig, (12, 4))
 
         # Generate spectrogram
-        f, t, Sxx = signal.spectrogram(
+        f, t, Sxx = _signal().spectrogram(
             audio, fs=SAMPLE_RATE, nperseg=2048, noverlap=1536
         )
 
@@ -717,7 +897,8 @@ def generate_spectrogram(audio: np.ndarray, output_path: Path, title: str = "")
         fig.colorbar(im, ax=ax, label='dB')
         fig.tight_layout()
         fig.savefig(output_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
+        if owns_fig:
+            plt.close(fig)
         return True
     except Exception as e:
         print(f"Error generating spectrogram: {e}")
@@ -729,7 +910,8 @@ def generate_spectrogram(audio: np.ndarray, output_path: Path, title: str = "")
 # =============================================================================
 
 def generate_automation_graph(showcase: ShowcaseConfig, output_path: Path,
-                               module_params: list[ModuleParam] = None, title: str = "") -> bool:
+                               module_params: tuple[ModuleParam, ...] = None, title: str = "",
+                               fig=None) -> bool:
     """Generate parameter values graph showing all parameters over time.
 
     Args:
@@ -737,6 +919,7 @@ def generate_automation_graph(showcase: ShowcaseConfig, output_path: Path,
         output_path: Output image path
         module_params: All module parameters (to show non-automated ones)
         title: Graph title
+        fig: Figure to draw on (cleared first); a new one is created if None
     """
     if not HAS_MATPLOTLIB:
         return False
@@ -745,7 +928,9 @@ def generate_automation_graph(showcase: ShowcaseConfig, output_path: Path,
         return False
 
     try:
-        fig, ax = plt.subplots(figsize=(12, 3))
+        plt = _plt()
+        owns_fig = fig is None
+        fig, ax = _prepare_figure(fig, (12, 3))
         ax.set_facecolor('#1a1a2e')
         fig.patch.set_facecolor('#1a1a2e')
 
@@ -843,7 +1028,8 @@ def generate_automation_graph(showcase: ShowcaseConfig, output_path: Path,
 
         fig.tight_layout()
         fig.savefig(output_path, dpi=100, bbox_inches='tight', facecolor='#1a1a2e')
-        plt.close(fig)
+        if owns_fig:
+            plt.close(fig)
         return True
     except Exception as e:
         print(f"Error generating automation graph: {e}")
@@ -868,8 +1054,12 @@ def volts_to_note_name(volts: float) -> str:
     return f"{note}{octave}"
 
 
-def generate_note_score(showcase: ShowcaseConfig, output_path: Path, title: str = "") -> bool:
-    """Generate piano roll / note score visualization."""
+def generate_note_score(showcase: ShowcaseConfig, output_path: Path, title: str = "",
+                        fig=None) -> bool:
+    """Generate piano roll / note score visualization.
+
+    Draws on fig (cleared first) when given, otherwise on a new figure.
+    """
     if not HAS_MATPLOTLIB:
         return False
 
@@ -877,7 +1067,9 @@ def generate_note_score(showcase: ShowcaseConfig, output_path: Path, title: str
         return False
 
     try:
-        fig, ax = plt.subplots(figsize=(12, 2.5))
+        plt = _plt()
+        owns_fig = fig is None
+        fig, ax = _prepare_figure(fig, (12, 2.5))
         ax.set_facecolor('#1a1a2e')
         fig.patch.set_facecolor('#1a1a2e')
 
@@ -932,13 +1124,48 @@ def generate_note_score(showcase: ShowcaseConfig, output_path: Path, title: str
 
         fig.tight_layout()
         fig.savefig(output_path, dpi=100, bbox_inches='tight', facecolor='#1a1a2e')
-        plt.close(fig)
+        if owns_fig:
+            plt.close(fig)
         return True
     except Exception as e:
         print(f"Error generating note score: {e}")
         return False
 
 
+def generate_all_visualizations(audio: np.ndarray, showcase: ShowcaseConfig,
+                                module_params: tuple[ModuleParam, ...], output_dir: Path,
+                                module_name: str) -> tuple[Path | None, Path | None, Path | None]:
+    """Generate spectrogram, parameter graph and note score on one shared figure.
+
+    Returns (spectrogram, automation_graph, note_score) paths, None for any
+    image that was not generated.
+    """
+    if not HAS_MATPLOTLIB:
+        return None, None, None
+
+    plt = _plt()
+    fig = plt.figure()
+    try:
+        spectrogram_path = output_dir / f"{module_name}_spectrogram.png"
+        if not generate_spectrogram(audio, spectrogram_path, module_name, fig=fig):
+            spectrogram_path = None
+
+        automation_path = output_dir / f"{module_name}_automation.png"
+        if not generate_automation_graph(showcase, automation_path, module_params,
+                                         "Parameter Values", fig=fig):
+            automation_path = None
+
+        note_path = None
+        if showcase.notes:
+            note_path = output_dir / f"{module_name}_notes.png"
+            if not generate_note_score(showcase, note_path, "Note Sequence", fig=fig):
+                note_path = None
+    finally:
+        plt.close(fig)
+
+    return spectrogram_path, automation_path, note_path
+
+
 # =============================================================================
 # AI Analysis
 # =============================================================================
@@ -1017,46 +1244,78 @@ def run_ai_analysis(wav_path: Path, module_name: str, showcase_context: str,
 # HTML Report Generation
 # =============================================================================
 
+# Same output as html.escape(s, quote=True), but in a single C-level pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def _escape(s: str) -> str:
+    """Escape text for HTML element content and attribute values."""
+    return s.translate(_HTML_ESCAPE_TABLE)
+
+
+_STATUS_COLORS = {
+    "pass": "#28a745",
+    "needs_work": "#ffc107",
+    "skip": "#6c757d",
+    "pending": "#17a2b8",
+    "error": "#dc3545",
+}
+
+_TOC_STATUS_COLORS = {"pass": "#28a745", "needs_work": "#ffc107", "skip": "#6c757d"}
+
+
+@functools.lru_cache(maxsize=None)
 def get_status_badge(status: str) -> str:
     """Get HTML badge for status."""
-    colors = {
-        "pass": "#28a745",
-        "needs_work": "#ffc107",
-        "skip": "#6c757d",
-        "pending": "#17a2b8",
-        "error": "#dc3545",
-    }
-    color = colors.get(status, "#6c757d")
+    color = _STATUS_COLORS.get(status, "#6c757d")
     return f'<span style="background:{color};color:white;padding:2px 8px;border-radius:4px;font-size:12px;">{status.upper()}</span>'
 
 
+_METRIC_BADGE = '<span style="color:{0};font-weight:bold;">{1:.1f}{2}</span>'.format
+
+
+def _pick_color(value: float, good_threshold: float, bad_threshold: float,
+                higher_is_better: bool) -> str:
+    """Pick the green/yellow/red badge color for a metric value."""
+    if higher_is_better:
+        if value >= good_threshold:
+            return "#28a745"
+        if value >= bad_threshold:
+            return "#ffc107"
+        return "#dc3545"
+    if value <= good_threshold:
+        return "#28a745"
+    if value <= bad_threshold:
+        return "#ffc107"
+    return "#dc3545"
+
+
 def get_metric_badge(value: float, good_threshold: float, bad_threshold: float,
                      unit: str = "", higher_is_better: bool = True) -> str:
     """Get HTML badge for a metric value."""
-    if higher_is_better:
-        if value >= good_threshold:
-            color = "#28a745"
-        elif value >= bad_threshold:
-            color = "#ffc107"
-        else:
-            color = "#dc3545"
-    else:
-        if value <= good_threshold:
-            color = "#28a745"
-        elif value <= bad_threshold:
-            color = "#ffc107"
-        else:
-            color = "#dc3545"
+    color = _pick_color(value, good_threshold, bad_threshold, higher_is_better)
+    return _METRIC_BADGE(color, value, unit)
+
 
-    return f'<span style="color:{color};font-weight:bold;">{value:.1f}{unit}</span>'
+def _encode_file_base64(path: Path) -> str:
+    """Base64-encode a file through a read-only mmap (no intermediate bytes copy)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _b64encode_str(mm)
 
 
 def encode_audio_base64(wav_path: Path) -> str | None:
     """Encode WAV file as base64 for inline audio player."""
     try:
-        with open(wav_path, "rb") as f:
-            data = f.read()
-        return base64.b64encode(data).decode('utf-8')
+        return _encode_file_base64(wav_path)
     except Exception:
         return None
 
@@ -1064,155 +1323,127 @@ def encode_audio_base64(wav_path: Path) -> str | None:
 def encode_image_base64(img_path: Path) -> str | None:
     """Encode image as base64 for inline display."""
     try:
-        with open(img_path, "rb") as f:
-            data = f.read()
-        return base64.b64encode(data).decode('utf-8')
+        return _encode_file_base64(img_path)
     except Exception:
         return None
 
 
-def generate_html_report(reports: list[ModuleReport], output_path: Path):
-    """Generate consolidated HTML report."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    # Count statuses
-    status_counts = {"pass": 0, "needs_work": 0, "skip": 0, "error": 0}
-    for r in reports:
-        status_counts[r.status] = status_counts.get(r.status, 0) + 1
-
-    # Build table of contents
-    toc_items = []
-    for report in reports:
-        status_color = {"pass": "#28a745", "needs_work": "#ffc107", "skip": "#6c757d"}.get(report.status, "#6c757d")
-        toc_items.append(
-            f'<a href="#module-{report.module_name}" class="toc-item">'
-            f'<span class="toc-status" style="background:{status_color};"></span>'
-            f'{report.module_name} <span class="toc-type">({report.module_type})</span></a>'
-        )
-    toc_html = "\n".join(toc_items)
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>WiggleRoom Showcase Report</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{
+_REPORT_CSS = """\
+        * { box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             margin: 0;
             padding: 20px;
             background: #1a1a2e;
             color: #eee;
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             padding: 20px;
             border-bottom: 1px solid #333;
             margin-bottom: 30px;
-        }}
-        .header h1 {{ margin: 0; color: #fff; }}
-        .header .stats {{ margin-top: 10px; font-size: 14px; color: #aaa; }}
-        .stats span {{ margin: 0 10px; }}
-        .module-card {{
+        }
+        .header h1 { margin: 0; color: #fff; }
+        .header .stats { margin-top: 10px; font-size: 14px; color: #aaa; }
+        .stats span { margin: 0 10px; }
+        .module-card {
             background: #16213e;
             border-radius: 12px;
             margin-bottom: 24px;
             padding: 20px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.3);
-        }}
-        .module-header {{
+        }
+        .module-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 16px;
             border-bottom: 1px solid #333;
             padding-bottom: 12px;
-        }}
-        .module-header h2 {{ margin: 0; color: #fff; }}
-        .module-type {{ color: #888; font-size: 14px; }}
-        .module-content {{
+        }
+        .module-header h2 { margin: 0; color: #fff; }
+        .module-type { color: #888; font-size: 14px; }
+        .module-content {
             display: grid;
             grid-template-columns: 1fr 1fr;
             gap: 20px;
-        }}
-        @media (max-width: 900px) {{
-            .module-content {{ grid-template-columns: 1fr; }}
-        }}
-        .audio-section {{
+        }
+        @media (max-width: 900px) {
+            .module-content { grid-template-columns: 1fr; }
+        }
+        .audio-section {
             background: #0f3460;
             border-radius: 8px;
             padding: 16px;
-        }}
-        .audio-section h3 {{ margin-top: 0; font-size: 14px; color: #aaa; }}
-        .audio-section audio {{ width: 100%; }}
-        .spectrogram {{ max-width: 100%; border-radius: 4px; margin-top: 10px; }}
-        .metrics-section {{
+        }
+        .audio-section h3 { margin-top: 0; font-size: 14px; color: #aaa; }
+        .audio-section audio { width: 100%; }
+        .spectrogram { max-width: 100%; border-radius: 4px; margin-top: 10px; }
+        .metrics-section {
             background: #0f3460;
             border-radius: 8px;
             padding: 16px;
-        }}
-        .metrics-section h3 {{ margin-top: 0; font-size: 14px; color: #aaa; }}
-        .metric-row {{
+        }
+        .metrics-section h3 { margin-top: 0; font-size: 14px; color: #aaa; }
+        .metric-row {
             display: flex;
             justify-content: space-between;
             padding: 6px 0;
             border-bottom: 1px solid #1a3a5e;
-        }}
-        .metric-row:last-child {{ border-bottom: none; }}
-        .metric-label {{ color: #888; }}
-        .ai-section {{ margin-top: 16px; }}
-        .ai-section h4 {{ margin: 0 0 8px 0; font-size: 13px; color: #aaa; }}
-        .character-tags {{ display: flex; flex-wrap: wrap; gap: 4px; }}
-        .character-tag {{
+        }
+        .metric-row:last-child { border-bottom: none; }
+        .metric-label { color: #888; }
+        .ai-section { margin-top: 16px; }
+        .ai-section h4 { margin: 0 0 8px 0; font-size: 13px; color: #aaa; }
+        .character-tags { display: flex; flex-wrap: wrap; gap: 4px; }
+        .character-tag {
             background: #1a3a5e;
             padding: 2px 8px;
             border-radius: 4px;
             font-size: 12px;
-        }}
-        .issues {{ margin-top: 10px; padding: 10px; background: #3a1c1c; border-radius: 4px; }}
-        .issues ul {{ margin: 0; padding-left: 20px; }}
-        .issues li {{ color: #ff8888; font-size: 13px; }}
-        .panel-section {{
+        }
+        .issues { margin-top: 10px; padding: 10px; background: #3a1c1c; border-radius: 4px; }
+        .issues ul { margin: 0; padding-left: 20px; }
+        .issues li { color: #ff8888; font-size: 13px; }
+        .panel-section {
             display: flex;
             align-items: flex-start;
             gap: 16px;
             margin-bottom: 16px;
-        }}
-        .panel-svg {{
+        }
+        .panel-svg {
             width: 120px;
             min-width: 120px;
             background: #1a1a2e;
             border-radius: 8px;
             padding: 8px;
             border: 1px solid #333;
-        }}
-        .panel-svg svg {{
+        }
+        .panel-svg svg {
             width: 100%;
             height: auto;
-        }}
-        .gemini-section {{
+        }
+        .gemini-section {
             margin-top: 16px;
             padding: 16px;
             background: #0a1628;
             border-radius: 8px;
             border-left: 3px solid #4ecdc4;
-        }}
-        .gemini-section h4 {{
+        }
+        .gemini-section h4 {
             margin: 0 0 12px 0;
             font-size: 14px;
             color: #4ecdc4;
-        }}
-        .gemini-content {{
+        }
+        .gemini-content {
             color: #ccc;
             font-size: 13px;
             line-height: 1.6;
             max-height: 400px;
             overflow-y: auto;
             white-space: pre-wrap;
-        }}
-        .gemini-toggle {{
+        }
+        .gemini-toggle {
             background: #1a3a5e;
             border: none;
             color: #aaa;
@@ -1221,26 +1452,26 @@ def generate_html_report(reports: list[ModuleReport], output_path: Path):
             cursor: pointer;
             font-size: 12px;
             margin-bottom: 8px;
-        }}
-        .gemini-toggle:hover {{ background: #2a4a6e; color: #fff; }}
-        .hidden {{ display: none; }}
-        .toc {{
+        }
+        .gemini-toggle:hover { background: #2a4a6e; color: #fff; }
+        .hidden { display: none; }
+        .toc {
             background: #16213e;
             border-radius: 12px;
             padding: 16px 20px;
             margin-bottom: 24px;
-        }}
-        .toc h3 {{
+        }
+        .toc h3 {
             margin: 0 0 12px 0;
             color: #fff;
             font-size: 16px;
-        }}
-        .toc-grid {{
+        }
+        .toc-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
             gap: 8px;
-        }}
-        .toc-item {{
+        }
+        .toc-item {
             display: flex;
             align-items: center;
             gap: 8px;
@@ -1251,76 +1482,249 @@ def generate_html_report(reports: list[ModuleReport], output_path: Path):
             text-decoration: none;
             font-size: 13px;
             transition: background 0.2s;
-        }}
-        .toc-item:hover {{ background: #1a4a7e; color: #fff; }}
-        .toc-status {{
+        }
+        .toc-item:hover { background: #1a4a7e; color: #fff; }
+        .toc-status {
             width: 8px;
             height: 8px;
             border-radius: 50%;
             flex-shrink: 0;
-        }}
-        .toc-type {{ color: #666; font-size: 11px; }}
-    </style>
+        }
+        .toc-type { color: #666; font-size: 11px; }
+"""
+
+_REPORT_HEAD = string.Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>WiggleRoom Showcase Report</title>
+    <style>
+${css}    </style>
 </head>
 <body>
     <div class="header">
         <h1>WiggleRoom Showcase Report</h1>
         <p class="stats">
-            Generated: {timestamp} |
-            <span style="color:#28a745;">Pass: {status_counts['pass']}</span> |
-            <span style="color:#ffc107;">Needs Work: {status_counts['needs_work']}</span> |
-            <span style="color:#6c757d;">Skip: {status_counts['skip']}</span>
+            Generated: ${timestamp} |
+            <span style="color:#28a745;">Pass: ${pass_count}</span> |
+            <span style="color:#ffc107;">Needs Work: ${needs_work_count}</span> |
+            <span style="color:#6c757d;">Skip: ${skip_count}</span>
         </p>
     </div>
     <div class="toc">
         <h3>Modules</h3>
         <div class="toc-grid">
-            {toc_html}
+            ${toc_html}
         </div>
     </div>
-"""
+""")
+
+_MODULE_CARD_HEAD = string.Template("""
+    <div class="module-card" id="module-${module_id}">
+        <div class="module-header">
+            <div>
+                <h2>${module_name}</h2>
+                <span class="module-type">${module_type} | ${duration}s</span>
+            </div>
+            ${status_badge}
+        </div>
+        <div class="panel-section">
+            ${panel_html}
+            <div style="flex:1;">
+                <p style="color:#888;margin:0 0 8px 0;font-size:14px;">${description}</p>
+            </div>
+        </div>
+        <div class="module-content">
+            <div class="audio-section">
+                <h3>Audio & Visualizations</h3>
+                """)
+
+# Audio player and visualization <img> tags are emitted between these two
+
+_MODULE_CARD_TAIL = string.Template("""
+            </div>
+            <div class="metrics-section">
+                <h3>Quality Metrics</h3>
+                ${metric_rows}
+                ${ai_html}
+                ${issues_html}
+                ${grid_link_html}
+            </div>
+        </div>
+        ${gemini_html}
+    </div>
+""")
 
-    for report in reports:
-        # Encode audio and images as base64 for inline embedding
-        audio_b64 = ""
-        if report.showcase_wav and report.showcase_wav.exists():
-            audio_b64 = encode_audio_base64(report.showcase_wav) or ""
+_METRIC_ROW = """<div class="metric-row">
+                    <span class="metric-label">{0}</span>
+                    {1}
+                </div>"""
 
-        spectrogram_b64 = ""
-        if report.spectrogram and report.spectrogram.exists():
-            spectrogram_b64 = encode_image_base64(report.spectrogram) or ""
+_SKIP_CARD = string.Template("""
+    <div class="module-card" id="module-${module_id}">
+        <div class="module-header">
+            <div>
+                <h2>${module_name}</h2>
+                <span class="module-type">${module_type}</span>
+            </div>
+            ${status_badge}
+        </div>
+        <p style="color:#888;margin:0;font-size:14px;">${reason}</p>
+    </div>
+""")
+
+_REPORT_FOOT = """
+</body>
+</html>
+"""
 
-        automation_b64 = ""
-        if report.automation_graph and report.automation_graph.exists():
-            automation_b64 = encode_image_base64(report.automation_graph) or ""
 
-        notes_b64 = ""
-        if report.note_score and report.note_score.exists():
-            notes_b64 = encode_image_base64(report.note_score) or ""
+class _DirIndex:
+    """Directory listings taken once with os.scandir, for cheap existence checks."""
 
-        # Load SVG panel content (not base64, just embed inline)
-        panel_svg_content = ""
-        if report.panel_svg and report.panel_svg.exists():
+    def __init__(self):
+        self._listings: dict[Path, frozenset[str]] = {}
+
+    def names(self, directory: Path) -> frozenset[str]:
+        """Get the entry names in a directory (empty if it does not exist)."""
+        listing = self._listings.get(directory)
+        if listing is None:
             try:
-                panel_svg_content = report.panel_svg.read_text()
-                # Clean up SVG for embedding (remove XML declaration if present)
-                if panel_svg_content.startswith("<?xml"):
-                    panel_svg_content = panel_svg_content[panel_svg_content.index("?>") + 2:].strip()
-            except Exception:
-                pass
-
-        # Quality metrics badges
-        peak_badge = get_metric_badge(report.quality.peak_amplitude, 0.3, 0.1, higher_is_better=True)
-        rms_badge = get_metric_badge(report.quality.rms_level, 0.1, 0.01, higher_is_better=True)
-        thd_badge = get_metric_badge(report.quality.thd_percent, 15.0, 30.0, "%", higher_is_better=False)
-        hnr_badge = get_metric_badge(report.quality.hnr_db, 10.0, 5.0, " dB", higher_is_better=True)
-        clip_badge = get_metric_badge(report.quality.clipping_percent, 1.0, 5.0, "%", higher_is_better=False)
-        dc_badge = get_metric_badge(abs(report.quality.dc_offset), 0.01, 0.1, "", higher_is_better=False)
-
-        # AI section (CLAP)
-        ai_html = ""
-        if report.ai.clap_quality_score > 0 or report.ai.clap_character:
-            ai_html = f"""
+                with os.scandir(directory) as it:
+                    listing = frozenset(entry.name for entry in it)
+            except OSError:
+                listing = frozenset()
+            self._listings[directory] = listing
+        return listing
+
+    def exists(self, path: Path) -> bool:
+        return path.name in self.names(path.parent)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_panel_svg(path_str: str, mtime_ns: int) -> str:
+    """Read a panel SVG cleaned up for inline embedding (cached per path and mtime)."""
+    try:
+        content = Path(path_str).read_text()
+        # Remove XML declaration if present
+        if content.startswith("<?xml"):
+            content = content[content.index("?>") + 2:].strip()
+        return content
+    except Exception:
+        return ""
+
+
+class _InlineAsset(NamedTuple):
+    """A file to be written into the report as a base64 data URI."""
+    path: Path
+    mime: str
+
+
+def _asset_src(path: Path, mime: str, asset_dir: Path | None) -> str | _InlineAsset:
+    """Get the src attribute for an asset: a relative URL, or an inline data URI.
+
+    Inline assets are returned as _InlineAsset so the writer can stream them.
+    """
+    if asset_dir is not None:
+        return Path(os.path.relpath(path, asset_dir)).as_posix()
+    return _InlineAsset(path, mime)
+
+
+def _inline_asset_str(asset: _InlineAsset) -> str:
+    """Encode an inline asset as a complete data URI string."""
+    if asset.mime.startswith("audio/"):
+        b64 = encode_audio_base64(asset.path)
+    else:
+        b64 = encode_image_base64(asset.path)
+    return f"data:{asset.mime};base64,{b64 or ''}"
+
+
+def stream_data_uri(asset: _InlineAsset, out, chunk_size: int = 48 * 1024) -> None:
+    """Write an inline asset into a text stream as a base64 data URI, chunk by chunk.
+
+    The file is opened before the data: prefix is written, so a missing
+    file gives an empty payload (as _inline_asset_str does); a read error
+    partway through propagates instead of leaving a truncated payload.
+    chunk_size is a multiple of 3 so no padding appears mid-stream.
+    """
+    try:
+        f = open(asset.path, "rb")
+    except OSError:
+        out.write(f"data:{asset.mime};base64,")
+        return
+    with f:
+        out.write(f"data:{asset.mime};base64,")
+        while chunk := f.read(chunk_size):
+            out.write(_b64encode_str(chunk))
+
+
+def _render_skip_card(report: ModuleReport) -> str:
+    """Render the compact card for a skipped module (name, type and reason)."""
+    return _SKIP_CARD.substitute(
+        module_id=report.module_name,
+        module_name=_escape(report.module_name),
+        module_type=_escape(report.module_type),
+        status_badge=get_status_badge(report.status),
+        reason=_escape("; ".join(report.issues) or "Audio tests skipped"),
+    )
+
+
+def iter_module_card(report: ModuleReport, asset_dir: Path | None = None,
+                     index: _DirIndex | None = None):
+    """Yield the HTML card for a single module piece by piece.
+
+    Audio and images are linked relative to asset_dir when it is given,
+    otherwise they are yielded as _InlineAsset pieces to embed as base64.
+    File existence is looked up in index, which can be shared across cards.
+    """
+    if report.status == "skip":
+        yield _render_skip_card(report)
+        return
+
+    if index is None:
+        index = _DirIndex()
+
+    audio_src = ""
+    if report.showcase_wav and index.exists(report.showcase_wav):
+        audio_src = _asset_src(report.showcase_wav, "audio/wav", asset_dir)
+
+    spectrogram_src = ""
+    if report.spectrogram and index.exists(report.spectrogram):
+        spectrogram_src = _asset_src(report.spectrogram, "image/png", asset_dir)
+
+    automation_src = ""
+    if report.automation_graph and index.exists(report.automation_graph):
+        automation_src = _asset_src(report.automation_graph, "image/png", asset_dir)
+
+    notes_src = ""
+    if report.note_score and index.exists(report.note_score):
+        notes_src = _asset_src(report.note_score, "image/png", asset_dir)
+
+    # Load SVG panel content (not base64, just embed inline)
+    panel_svg_content = ""
+    if report.panel_svg and index.exists(report.panel_svg):
+        try:
+            panel_svg_content = _load_panel_svg(
+                str(report.panel_svg), report.panel_svg.stat().st_mtime_ns)
+        except OSError:
+            pass
+
+    # Quality metrics rows
+    q = report.quality
+    metric_rows = "\n                ".join(_METRIC_ROW.format(label, badge) for label, badge in (
+        ("Peak Amplitude", get_metric_badge(q.peak_amplitude, 0.3, 0.1, higher_is_better=True)),
+        ("RMS Level", get_metric_badge(q.rms_level, 0.1, 0.01, higher_is_better=True)),
+        ("THD", get_metric_badge(q.thd_percent, 15.0, 30.0, "%", higher_is_better=False)),
+        ("HNR", get_metric_badge(q.hnr_db, 10.0, 5.0, " dB", higher_is_better=True)),
+        ("Clipping", get_metric_badge(q.clipping_percent, 1.0, 5.0, "%", higher_is_better=False)),
+        ("DC Offset", get_metric_badge(abs(q.dc_offset), 0.01, 0.1, "", higher_is_better=False)),
+    ))
+
+    # AI section (CLAP)
+    ai_html = ""
+    if report.ai.clap_quality_score > 0 or report.ai.clap_character:
+        ai_html = f"""
             <div class="ai-section">
                 <h4>CLAP Analysis</h4>
                 <div class="metric-row">
@@ -1328,51 +1732,52 @@ def generate_html_report(reports: list[ModuleReport], output_path: Path):
                     <span>{report.ai.clap_quality_score:.0f}/100</span>
                 </div>
                 <div class="character-tags">
-                    {"".join(f'<span class="character-tag">{html.escape(c)}</span>' for c in report.ai.clap_character[:5])}
+                    {"".join(f'<span class="character-tag">{_escape(c)}</span>' for c in report.ai.clap_character[:5])}
                 </div>
             </div>
             """
 
-        # Gemini section
-        gemini_html = ""
-        if report.gemini_analysis:
-            module_id = report.module_name.replace(" ", "_").lower()
-            gemini_html = f"""
+    # Gemini section
+    gemini_html = ""
+    if report.gemini_analysis:
+        module_id = report.module_name.replace(" ", "_").lower()
+        gemini_html = f"""
             <div class="gemini-section">
                 <h4>Gemini Analysis</h4>
                 <button class="gemini-toggle" onclick="document.getElementById('gemini-{module_id}').classList.toggle('hidden')">
                     Toggle Details
                 </button>
                 <div id="gemini-{module_id}" class="gemini-content">
-{html.escape(report.gemini_analysis)}
+{_escape(report.gemini_analysis)}
                 </div>
             </div>
             """
 
-        # Panel SVG section
-        panel_html = ""
-        if panel_svg_content:
-            panel_html = f"""<div class="panel-svg">{panel_svg_content}</div>"""
+    # Panel SVG section
+    panel_html = ""
+    if panel_svg_content:
+        panel_html = f"""<div class="panel-svg">{panel_svg_content}</div>"""
 
-        # Issues section
-        issues_html = ""
-        if report.issues:
-            issues_html = f"""
+    # Issues section
+    issues_html = ""
+    if report.issues:
+        issues_html = f"""
             <div class="issues">
                 <ul>
-                    {"".join(f'<li>{html.escape(issue)}</li>' for issue in report.issues)}
+                    {"".join(f'<li>{_escape(issue)}</li>' for issue in report.issues)}
                 </ul>
             </div>
             """
 
-        # Parameter grid link (if exists)
-        grid_link_html = ""
-        grid_report_path = OUTPUT_DIR / "param_grids" / f"{report.module_name}.html"
-        if grid_report_path.exists():
-            # Count clips from directory
-            grid_dir = OUTPUT_DIR / "param_grids" / report.module_name
-            clip_count = len(list(grid_dir.glob("perm_*.wav"))) if grid_dir.exists() else 0
-            grid_link_html = f"""
+    # Parameter grid link (if exists)
+    grid_link_html = ""
+    grid_report_path = OUTPUT_DIR / "param_grids" / f"{report.module_name}.html"
+    if index.exists(grid_report_path):
+        # Count clips from directory
+        grid_dir = OUTPUT_DIR / "param_grids" / report.module_name
+        clip_count = sum(1 for name in index.names(grid_dir)
+                         if name.startswith("perm_") and name.endswith(".wav"))
+        grid_link_html = f"""
             <div style="margin-top:12px;padding:10px;background:#0a1628;border-radius:6px;border-left:3px solid #4ecdc4;">
                 <a href="param_grids/{report.module_name}.html" style="color:#4ecdc4;text-decoration:none;font-size:13px;">
                     📊 Parameter Grid Analysis ({clip_count} permutations)
@@ -1380,77 +1785,113 @@ def generate_html_report(reports: list[ModuleReport], output_path: Path):
             </div>
             """
 
-        # Build visualizations HTML
-        vis_html = ""
-        if spectrogram_b64:
-            vis_html += f"<img class='spectrogram' src='data:image/png;base64,{spectrogram_b64}' alt='Spectrogram'>"
-        if notes_b64:
-            vis_html += f"<img class='spectrogram' src='data:image/png;base64,{notes_b64}' alt='Note Score' style='margin-top:8px;'>"
-        if automation_b64:
-            vis_html += f"<img class='spectrogram' src='data:image/png;base64,{automation_b64}' alt='Parameter Automation' style='margin-top:8px;'>"
-
-        html_content += f"""
-    <div class="module-card" id="module-{report.module_name}">
-        <div class="module-header">
-            <div>
-                <h2>{html.escape(report.module_name)}</h2>
-                <span class="module-type">{html.escape(report.module_type)} | {report.duration:.1f}s</span>
-            </div>
-            {get_status_badge(report.status)}
-        </div>
-        <div class="panel-section">
-            {panel_html}
-            <div style="flex:1;">
-                <p style="color:#888;margin:0 0 8px 0;font-size:14px;">{html.escape(report.description)}</p>
-            </div>
-        </div>
-        <div class="module-content">
-            <div class="audio-section">
-                <h3>Audio & Visualizations</h3>
-                {"<audio controls><source src='data:audio/wav;base64," + audio_b64 + "' type='audio/wav'></audio>" if audio_b64 else "<p>No audio available</p>"}
-                {vis_html if vis_html else "<p>No visualizations available</p>"}
-            </div>
-            <div class="metrics-section">
-                <h3>Quality Metrics</h3>
-                <div class="metric-row">
-                    <span class="metric-label">Peak Amplitude</span>
-                    {peak_badge}
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">RMS Level</span>
-                    {rms_badge}
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">THD</span>
-                    {thd_badge}
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">HNR</span>
-                    {hnr_badge}
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">Clipping</span>
-                    {clip_badge}
-                </div>
-                <div class="metric-row">
-                    <span class="metric-label">DC Offset</span>
-                    {dc_badge}
-                </div>
-                {ai_html}
-                {issues_html}
-                {grid_link_html}
-            </div>
-        </div>
-        {gemini_html}
-    </div>
-"""
+    # Quality metrics and the rest of the card after the visualizations
+    tail = _MODULE_CARD_TAIL.substitute(
+        metric_rows=metric_rows,
+        ai_html=ai_html,
+        issues_html=issues_html,
+        grid_link_html=grid_link_html,
+        gemini_html=gemini_html,
+    )
 
-    html_content += """
-</body>
-</html>
-"""
+    yield _MODULE_CARD_HEAD.substitute(
+        module_id=report.module_name,
+        module_name=_escape(report.module_name),
+        module_type=_escape(report.module_type),
+        duration=f"{report.duration:.1f}",
+        status_badge=get_status_badge(report.status),
+        panel_html=panel_html,
+        description=_escape(report.description),
+    )
 
-    output_path.write_text(html_content)
+    if audio_src:
+        yield from ("<audio controls><source src='", audio_src, "' type='audio/wav'></audio>")
+    else:
+        yield "<p>No audio available</p>"
+    yield "\n                "
+
+    # Visualizations
+    if spectrogram_src:
+        yield from ("<img class='spectrogram' src='", spectrogram_src, "' alt='Spectrogram'>")
+    if notes_src:
+        yield from ("<img class='spectrogram' src='", notes_src,
+                    "' alt='Note Score' style='margin-top:8px;'>")
+    if automation_src:
+        yield from ("<img class='spectrogram' src='", automation_src,
+                    "' alt='Parameter Automation' style='margin-top:8px;'>")
+    if not (spectrogram_src or notes_src or automation_src):
+        yield "<p>No visualizations available</p>"
+
+    yield tail
+
+
+def render_module_card(report: ModuleReport, asset_dir: Path | None = None,
+                       index: _DirIndex | None = None) -> str:
+    """Render the HTML card for a single module as one string."""
+    return "".join(
+        _inline_asset_str(piece) if isinstance(piece, _InlineAsset) else piece
+        for piece in iter_module_card(report, asset_dir, index)
+    )
+
+
+def iter_report_html(reports: list[ModuleReport], asset_dir: Path | None = None,
+                     max_workers: int = 1):
+    """Yield the consolidated HTML report piece by piece.
+
+    Inline assets are yielded as _InlineAsset pieces for the writer to
+    stream. With max_workers > 1 the module cards (and the base64 encoding
+    of their inlined assets) are instead rendered to complete strings on a
+    thread pool, still yielded in order.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # Count statuses
+    status_counts = Counter(r.status for r in reports)
+
+    # Build table of contents
+    toc_html = "\n".join(
+        f'<a href="#module-{report.module_name}" class="toc-item">'
+        f'<span class="toc-status" style="background:{_TOC_STATUS_COLORS.get(report.status, "#6c757d")};"></span>'
+        f'{report.module_name} <span class="toc-type">({report.module_type})</span></a>'
+        for report in reports
+    )
+
+    yield _REPORT_HEAD.substitute(
+        css=_REPORT_CSS,
+        timestamp=timestamp,
+        pass_count=status_counts['pass'],
+        needs_work_count=status_counts['needs_work'],
+        skip_count=status_counts['skip'],
+        toc_html=toc_html,
+    )
+
+    # One scandir per directory instead of a stat() per asset
+    index = _DirIndex()
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(render_module_card, reports,
+                                    [asset_dir] * len(reports), [index] * len(reports))
+    else:
+        for report in reports:
+            yield from iter_module_card(report, asset_dir, index)
+
+    yield _REPORT_FOOT
+
+
+def generate_html_report(reports: list[ModuleReport], output_path: Path,
+                         inline_assets: bool = False, max_workers: int = 1):
+    """Generate consolidated HTML report, streaming it straight to disk.
+
+    By default audio and images are referenced as files next to the report.
+    Pass inline_assets=True to embed them for a self-contained single file.
+    """
+    asset_dir = None if inline_assets else output_path.parent
+    with output_path.open("w", encoding="utf-8") as f:
+        for piece in iter_report_html(reports, asset_dir, max_workers):
+            if isinstance(piece, _InlineAsset):
+                stream_data_uri(piece, f)
+            else:
+                f.write(piece)
     print(f"Report written to: {output_path}")
 
 
@@ -1513,24 +1954,12 @@ def process_module(module_name: str, output_dir: Path,
     if panel_svg:
         report.panel_svg = panel_svg
 
-    # Generate spectrogram
-    spectrogram_path = output_dir / f"{module_name}_spectrogram.png"
-    if generate_spectrogram(audio, spectrogram_path, module_name):
-        report.spectrogram = spectrogram_path
-
-    # Get module parameters for complete parameter graph
+    # Generate spectrogram, parameter values graph (all params, with
+    # automations highlighted) and note score
     module_params = get_module_params(module_name)
-
-    # Generate parameter values graph (all params, with automations highlighted)
-    automation_path = output_dir / f"{module_name}_automation.png"
-    if generate_automation_graph(showcase, automation_path, module_params, "Parameter Values"):
-        report.automation_graph = automation_path
-
-    # Generate note score visualization
-    if showcase.notes:
-        note_path = output_dir / f"{module_name}_notes.png"
-        if generate_note_score(showcase, note_path, "Note Sequence"):
-            report.note_score = note_path
+    report.spectrogram, report.automation_graph, report.note_score = generate_all_visualizations(
+        audio, showcase, module_params, output_dir, module_name
+    )
 
     # Analyze quality
     if verbose:
@@ -1548,30 +1977,78 @@ def process_module(module_name: str, output_dir: Path,
         )
 
     # Determine status based on quality metrics
-    issues = []
+    apply_quality_thresholds([report])
 
-    # Check quality thresholds
-    thresholds = config.get("quality_thresholds", {})
-    thd_max = thresholds.get("thd_max_percent", 15.0)
-    clipping_max = thresholds.get("clipping_max_percent", 1.0)
-    if thresholds.get("allow_hot_signal", False):
-        clipping_max = 15.0  # More lenient for hot signal modules
+    return report
+
+
+def _worker_init():
+    """Import the plotting/analysis stack once per Phase 2 worker process."""
+    if HAS_MATPLOTLIB:
+        _plt()
+    if HAS_SCIPY:
+        _signal()
+        _wavfile()
+
+
+def analyze_module(module_name: str, wav_path: Path | None, output_dir: Path,
+                   showcase: ShowcaseConfig | None = None) -> ModuleReport:
+    """Analyze a single rendered module (called in a Phase 2 worker process).
+
+    Uses the given systematic showcase if any, otherwise the module's own.
+    """
+    config = load_module_config(module_name)
+    module_type = config.get("module_type", "instrument")
+    description = config.get("description", "")
+    skip_audio = config.get("skip_audio_tests", False)
+
+    report = ModuleReport(
+        module_name=module_name,
+        module_type=module_type,
+        description=description,
+    )
+
+    if skip_audio:
+        report.status = "skip"
+        report.issues.append(config.get("skip_reason", "Audio tests skipped"))
+        return report
+
+    if not wav_path or not wav_path.exists():
+        report.status = "error"
+        report.issues.append("Audio file not found")
+        return report
+
+    report.showcase_wav = wav_path
+
+    # Load audio
+    audio = load_audio(wav_path)
+    if audio is None:
+        report.status = "error"
+        report.issues.append("Failed to load audio")
+        return report
 
-    if report.quality.thd_percent > thd_max:
-        issues.append(f"THD {report.quality.thd_percent:.1f}% exceeds threshold {thd_max}%")
+    report.duration = len(audio) / SAMPLE_RATE
 
-    if report.quality.clipping_percent > clipping_max:
-        issues.append(f"Clipping {report.quality.clipping_percent:.1f}% exceeds threshold {clipping_max}%")
+    # Use systematic config if available, otherwise parse from file
+    if showcase is None:
+        showcase = parse_showcase_config(config, module_type)
+    report.showcase_config = showcase
 
-    if report.quality.peak_amplitude < 0.1:
-        issues.append("Very low output level (peak < 0.1)")
+    # Panel SVG
+    panel_svg = get_panel_svg(module_name)
+    if panel_svg:
+        report.panel_svg = panel_svg
 
-    if abs(report.quality.dc_offset) > 0.1:
-        issues.append(f"Significant DC offset: {report.quality.dc_offset:.3f}")
+    # Generate visualizations
+    module_params = get_module_params(module_name)
+    report.spectrogram, report.automation_graph, report.note_score = generate_all_visualizations(
+        audio, showcase, module_params, output_dir, module_name
+    )
 
-    report.issues = issues
-    report.status = "pass" if not issues else "needs_work"
+    # Quality analysis
+    report.quality = analyze_quality(audio)
 
+    # Status is set for all modules at once by apply_quality_thresholds
     return report
 
 
@@ -1583,6 +2060,8 @@ def main():
                         help="Output HTML file path")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--json", action="store_true", help="Also output JSON report")
+    parser.add_argument("--inline-assets", action="store_true",
+                        help="Embed audio and images in the HTML as base64 (self-contained report)")
     parser.add_argument("--parallel", "-p", type=int, default=4,
                         help="Number of parallel workers (default: 4)")
     parser.add_argument("--systematic", "-s", action="store_true",
@@ -1600,7 +2079,7 @@ def main():
     if args.module:
         modules = [args.module]
     else:
-        modules = get_available_modules()
+        modules = list(get_available_modules())
         if not modules:
             print("No modules found. Ensure faust_render is built.")
             sys.exit(1)
@@ -1622,170 +2101,77 @@ def main():
 
     # Phase 1: Render all audio in parallel
     print("\n=== Phase 1: Rendering audio ===")
-    wav_paths = {}
-
-    def render_module(module: str) -> tuple[str, Path, bool]:
-        wav_path = OUTPUT_DIR / f"{module}_showcase.wav"
-        if module in systematic_configs:
-            # Use systematic config - write temp config for faust_render
-            success = render_showcase_with_config(
-                module, wav_path, systematic_configs[module], args.verbose
-            )
-        else:
-            success = render_showcase(module, wav_path, args.verbose)
-        return module, wav_path, success
-
-    with ThreadPoolExecutor(max_workers=args.parallel) as executor:
-        futures = [executor.submit(render_module, m) for m in modules]
-
-        for future in as_completed(futures):
-            try:
-                module, wav_path, success = future.result()
-                if success:
-                    wav_paths[module] = wav_path
-                    print(f"  ✓ {module}")
-                else:
-                    print(f"  ✗ {module} (render failed)")
-            except Exception as e:
-                print(f"  ✗ (error: {e})")
+    wav_paths = asyncio.run(render_all_showcases(
+        modules, OUTPUT_DIR, systematic_configs, args.parallel, args.verbose
+    ))
 
     # Phase 2: Process analysis in parallel (quality, visualizations)
     print("\n=== Phase 2: Analyzing audio ===")
     reports = []
 
-    def analyze_module(module_name: str) -> ModuleReport:
-        """Analyze a single module (called in parallel)."""
-        config = load_module_config(module_name)
-        module_type = config.get("module_type", "instrument")
-        description = config.get("description", "")
-        skip_audio = config.get("skip_audio_tests", False)
-
-        report = ModuleReport(
-            module_name=module_name,
-            module_type=module_type,
-            description=description,
-        )
-
-        if skip_audio:
-            report.status = "skip"
-            report.issues.append(config.get("skip_reason", "Audio tests skipped"))
-            return report
-
-        wav_path = wav_paths.get(module_name)
-        if not wav_path or not wav_path.exists():
-            report.status = "error"
-            report.issues.append("Audio file not found")
-            return report
-
-        report.showcase_wav = wav_path
-
-        # Load audio
-        audio = load_audio(wav_path)
-        if audio is None:
-            report.status = "error"
-            report.issues.append("Failed to load audio")
-            return report
-
-        report.duration = len(audio) / SAMPLE_RATE
-
-        # Use systematic config if available, otherwise parse from file
-        if module_name in systematic_configs:
-            showcase = systematic_configs[module_name]
-        else:
-            showcase = parse_showcase_config(config, module_type)
-        report.showcase_config = showcase
-
-        # Panel SVG
-        panel_svg = get_panel_svg(module_name)
-        if panel_svg:
-            report.panel_svg = panel_svg
-
-        # Generate visualizations
-        spectrogram_path = OUTPUT_DIR / f"{module_name}_spectrogram.png"
-        if generate_spectrogram(audio, spectrogram_path, module_name):
-            report.spectrogram = spectrogram_path
-
-        module_params = get_module_params(module_name)
-        automation_path = OUTPUT_DIR / f"{module_name}_automation.png"
-        if generate_automation_graph(showcase, automation_path, module_params, "Parameter Values"):
-            report.automation_graph = automation_path
-
-        if showcase.notes:
-            note_path = OUTPUT_DIR / f"{module_name}_notes.png"
-            if generate_note_score(showcase, note_path, "Note Sequence"):
-                report.note_score = note_path
-
-        # Quality analysis
-        report.quality = analyze_quality(audio)
-
-        # Determine status
-        thresholds = config.get("quality_thresholds", {})
-        thd_max = thresholds.get("thd_max_percent", 15.0)
-        clipping_max = thresholds.get("clipping_max_percent", 1.0)
-        if thresholds.get("allow_hot_signal", False):
-            clipping_max = 15.0
-
-        issues = []
-        if report.quality.thd_percent > thd_max:
-            issues.append(f"THD {report.quality.thd_percent:.1f}% exceeds threshold {thd_max}%")
-        if report.quality.clipping_percent > clipping_max:
-            issues.append(f"Clipping {report.quality.clipping_percent:.1f}% exceeds threshold {clipping_max}%")
-        if report.quality.peak_amplitude < 0.1:
-            issues.append("Very low output level (peak < 0.1)")
-        if abs(report.quality.dc_offset) > 0.1:
-            issues.append(f"Significant DC offset: {report.quality.dc_offset:.3f}")
-
-        report.issues = issues
-        report.status = "pass" if not issues else "needs_work"
-        return report
-
-    with ThreadPoolExecutor(max_workers=args.parallel) as executor:
-        futures = {executor.submit(analyze_module, m): m for m in modules}
+    with ProcessPoolExecutor(max_workers=args.parallel, initializer=_worker_init) as executor:
+        futures = {
+            executor.submit(analyze_module, m, wav_paths.get(m), OUTPUT_DIR,
+                            systematic_configs.get(m)): m
+            for m in modules
+        }
         for future in as_completed(futures):
             module = futures[future]
             try:
                 report = future.result()
                 reports.append(report)
-                print(f"  ✓ {module} ({report.status})")
+                status = "analyzed" if report.status == "pending" else report.status
+                print(f"  ✓ {module} ({status})")
             except Exception as e:
                 print(f"  ✗ {module} (error: {e})")
                 import traceback
                 traceback.print_exc()
 
+    apply_quality_thresholds(reports)
+
     # Phase 3: AI analysis
     use_clap = not args.no_clap
     use_gemini_opt = not args.no_gemini
     if not args.skip_ai and (use_clap or use_gemini_opt):
         print(f"\n=== Phase 3: AI analysis (CLAP: {use_clap}, Gemini: {use_gemini_opt}) ===")
-        for report in reports:
-            if report.status in ("skip", "error"):
-                continue
-            print(f"  Analyzing {report.module_name}...")
-            # Use the showcase config already stored in the report
-            showcase_context = format_showcase_context(report.showcase_config, report.module_type)
-            report.ai, report.gemini_analysis = run_ai_analysis(
-                report.showcase_wav, report.module_name, showcase_context, args.verbose,
-                use_clap=use_clap, use_gemini=use_gemini_opt
-            )
+        # CLAP/Gemini calls are independent per module and mostly I/O-bound
+        with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+            futures = {}
+            for report in reports:
+                if report.status in ("skip", "error"):
+                    continue
+                print(f"  Analyzing {report.module_name}...")
+                # Use the showcase config already stored in the report
+                showcase_context = format_showcase_context(report.showcase_config, report.module_type)
+                future = executor.submit(
+                    run_ai_analysis, report.showcase_wav, report.module_name, showcase_context,
+                    args.verbose, use_clap=use_clap, use_gemini=use_gemini_opt
+                )
+                futures[future] = report
+
+            for future in as_completed(futures):
+                report = futures[future]
+                report.ai, report.gemini_analysis = future.result()
 
     # Sort reports by module name
     reports.sort(key=lambda r: r.module_name)
 
     # Generate HTML report
     output_path = Path(args.output)
-    generate_html_report(reports, output_path)
+    generate_html_report(reports, output_path, inline_assets=args.inline_assets,
+                         max_workers=args.parallel)
 
     # Optionally output JSON
     if args.json:
         json_path = output_path.with_suffix(".json")
-        with open(json_path, "w") as f:
-            json.dump([r.to_dict() for r in reports], f, indent=2)
+        _dump_json([r.to_dict() for r in reports], json_path)
         print(f"JSON report written to: {json_path}")
 
     # Summary
     print("\nSummary:")
+    status_counts = Counter(r.status for r in reports)
     for status in ["pass", "needs_work", "skip", "error"]:
-        count = sum(1 for r in reports if r.status == status)
+        count = status_counts[status]
         if count > 0:
             print(f"  {status.upper()}: {count}")
 
@@ -6,7 +6,7 @@ Generates a comprehensive report for PR reviewers to perform final audio quality
 Combines showcase audio, quality metrics, and optional AI analysis in a single report.
 
 Modes:
-    --fast:   Showcase + quality metrics only (no AI, fast CI mode)
+    --fast:   Showcase + quality metrics only (no AI or plots, fast CI mode)
     default:  Showcase + quality + CLAP analysis (standard PR review)
     --full:   Everything including param grid and Gemini analysis (deep dive)
 
@@ -15,21 +15,37 @@ Usage:
     python generate_unified_report.py --fast       # Fast mode (no AI)
     python generate_unified_report.py --full       # Full mode with Gemini
     python generate_unified_report.py -m ChaosFlute  # Specific module
+    python generate_unified_report.py --no-inline-assets  # Media in assets/ dir
 """
 
 import argparse
 import base64
+import functools
+import hashlib
 import html
+import io
 import json
+import math
+import mmap
+import multiprocessing
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, deque
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
 import numpy as np
 
@@ -37,43 +53,103 @@ import numpy as np
 sys.path.insert(0, str(Path(__file__).parent))
 from utils import (
     get_project_root, get_render_executable, load_module_config,
-    get_module_params, load_audio, format_value, generate_param_bar_html,
-    volts_to_note_name, SAMPLE_RATE, DEFAULT_QUALITY_THRESHOLDS
+    get_module_params, load_audio, fused_audio_stats, format_value,
+    generate_param_bar_html, volts_to_note_name, SAMPLE_RATE, DEFAULT_QUALITY_THRESHOLDS
 )
 
 # Load .env file if present
+_DOTENV_LOADED = False
+
+
 def load_dotenv():
-    """Load environment variables from .env file."""
-    env_path = get_project_root() / ".env"
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+    """Load environment variables from .env file (once per process)."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
+
+    try:
+        text = (get_project_root() / ".env").read_text()
+    except OSError:
+        return
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if sep and key and not key.startswith("#"):
+            os.environ.setdefault(key, value.strip())
 
 load_dotenv()
 
-# Optional dependencies
+# Optional dependencies (only probed here; imported on first use so that
+# --fast runs never pay for loading matplotlib)
+HAS_SCIPY = find_spec("scipy") is not None
+HAS_MATPLOTLIB = find_spec("matplotlib") is not None
+
+
+def _has_module(name: str) -> bool:
+    """True if ``name`` is importable, without importing it (or its parents)."""
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# AI backends live in ai_audio_analysis and pull in torch/transformers or the
+# Gemini SDK; probe them up front so a run that needs them fails before any
+# rendering instead of discovering the gap after the module fan-out
+HAS_CLAP_DEPS = all(_has_module(m) for m in ("torch", "transformers", "librosa"))
+HAS_GEMINI_DEPS = _has_module("google.generativeai")
+
 try:
-    from scipy.io import wavfile
-    from scipy import signal
-    HAS_SCIPY = True
+    import orjson
+
+    def _dumps_indented(obj) -> bytes:
+        """Serialize obj as 2-space indented JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
 except ImportError:
-    HAS_SCIPY = False
+    def _dumps_indented(obj) -> bytes:
+        """Serialize obj as 2-space indented JSON."""
+        return json.dumps(obj, indent=2).encode()
 
 try:
+    from tqdm import tqdm
+    HAS_TQDM = True
+except ImportError:
+    HAS_TQDM = False
+
+
+@functools.cache
+def _get_scipy_signal():
+    from scipy import signal
+    return signal
+
+
+@functools.cache
+def _get_plt():
     import matplotlib
     matplotlib.use('Agg')
     import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+    return plt
 
 
 # Configuration
 OUTPUT_DIR = Path(__file__).parent / "output"
+# Last known per-module processing times, used to schedule slow modules first
+MODULE_TIMES_PATH = OUTPUT_DIR / ".module_times.json"
+
+# Analysis window sizes (windows are built once by _get_window; the
+# spectrogram keeps scipy's default Tukey window)
+WELCH_NPERSEG = 4096
+# Spectrograms only show 0-8 kHz, so they are computed at 16 kHz
+SPEC_RATE = 16000
+SPEC_NPERSEG = 1024
+SPEC_NOVERLAP = 768
+
+
+@functools.cache
+def _get_window(window: str | tuple, nperseg: int) -> np.ndarray:
+    """Build an analysis window once per (window, nperseg)."""
+    return _get_scipy_signal().get_window(window, nperseg)
 
 
 # =============================================================================
@@ -154,8 +230,32 @@ class ModuleReport:
     status: str = "pending"  # pass, needs_work, skip, error
     issues: list[str] = field(default_factory=list)
     duration: float = 0.0
+    process_seconds: float = 0.0  # wall time spent in process_module
     param_permutations: list[ParamPermutation] = field(default_factory=list)
 
+    # HTML-escaped text fields for the report. Plain properties rather than
+    # cached ones: process_module keeps changing issues and gemini_analysis
+    # after the report is created, so a cached value could go stale.
+    @property
+    def module_name_html(self) -> str:
+        return html.escape(self.module_name)
+
+    @property
+    def module_type_html(self) -> str:
+        return html.escape(self.module_type)
+
+    @property
+    def description_html(self) -> str:
+        return html.escape(self.description)
+
+    @property
+    def gemini_analysis_html(self) -> str:
+        return html.escape(self.gemini_analysis)
+
+    @property
+    def issues_html(self) -> tuple[str, ...]:
+        return tuple(html.escape(issue) for issue in self.issues)
+
     def to_dict(self) -> dict:
         result = {
             "module_name": self.module_name,
@@ -187,7 +287,13 @@ class ReportConfig:
     skip_clap: bool = False
     skip_gemini: bool = True
     include_param_grid: bool = False
+    skip_plots: bool = False
+    fast_images: bool = False  # axis-less spectrogram images without matplotlib figures
+    inline_assets: bool = True
+    external_assets: bool = False
     parallel_workers: int = 4
+    executor: str = "process"  # process or thread
+    use_render_cache: bool = True  # reuse showcase WAVs whose inputs are unchanged
     verbose: bool = False
     output_path: Path = OUTPUT_DIR / "unified_report.html"
 
@@ -196,11 +302,12 @@ class ReportConfig:
 # Utility Functions
 # =============================================================================
 
-def get_available_modules() -> list[str]:
-    """Get list of available modules from faust_render."""
+@functools.lru_cache(maxsize=None)
+def get_available_modules() -> tuple[str, ...]:
+    """Get list of available modules from faust_render (queried once)."""
     exe = get_render_executable()
     if not exe.exists():
-        return []
+        return ()
 
     try:
         result = subprocess.run(
@@ -212,17 +319,36 @@ def get_available_modules() -> list[str]:
             line = line.strip()
             if line and not line.startswith("Available"):
                 modules.append(line)
-        return modules
+        return tuple(modules)
     except Exception:
-        return []
+        return ()
+
+
+@functools.lru_cache(maxsize=None)
+def get_module_config(module_name: str) -> dict[str, Any]:
+    """Load a module's test configuration (parsed once per module).
+
+    The result is shared; callers must not modify it.
+    """
+    return load_module_config(module_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _panel_svg_names() -> frozenset[str]:
+    """File names in res/, listed with a single scandir."""
+    try:
+        with os.scandir(get_project_root() / "res") as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
 
 
+@functools.lru_cache(maxsize=None)
 def get_panel_svg(module_name: str) -> Path | None:
     """Get path to module's SVG panel."""
-    project_root = get_project_root()
-    svg_path = project_root / "res" / f"{module_name}.svg"
-    if svg_path.exists():
-        return svg_path
+    name = f"{module_name}.svg"
+    if name in _panel_svg_names():
+        return get_project_root() / "res" / name
     return None
 
 
@@ -344,7 +470,12 @@ def render_showcase(module_name: str, output_path: Path, verbose: bool = False)
     ]
 
     try:
-        result = subprocess.run(args, capture_output=True, text=True, timeout=120)
+        # Only stderr is needed for error reporting; discard stdout unless it
+        # will be printed so the pipe isn't buffered and decoded for nothing
+        result = subprocess.run(
+            args, stdout=subprocess.PIPE if verbose else subprocess.DEVNULL,
+            stderr=subprocess.PIPE, text=True, timeout=120
+        )
         if verbose and result.stdout:
             print(result.stdout)
         if result.returncode != 0:
@@ -362,10 +493,39 @@ def render_showcase(module_name: str, output_path: Path, verbose: bool = False)
         return False
 
 
+def showcase_cache_key(module_name: str) -> str | None:
+    """Hash of everything a showcase render depends on.
+
+    Covers the module's test_config.json (which holds the showcase) and the
+    faust_render binary (which has the DSP compiled in). Returns None if the
+    binary is missing.
+    """
+    exe = get_render_executable()
+    try:
+        exe_stat = exe.stat()
+    except OSError:
+        return None
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{module_name}\0{SAMPLE_RATE}\0{exe_stat.st_mtime_ns}\0{exe_stat.st_size}\0".encode())
+    config_path = get_project_root() / "src" / "modules" / module_name / "test_config.json"
+    try:
+        h.update(config_path.read_bytes())
+    except OSError:
+        pass
+    return h.hexdigest()
+
+
 # =============================================================================
 # Audio Analysis
 # =============================================================================
 
+# Autocorrelation window and lag range for the HNR estimate
+HNR_WINDOW = 4096
+HNR_MIN_LAG = 100
+HNR_MAX_LAG = 1000
+
+
 def analyze_quality(audio: np.ndarray) -> QualityMetrics:
     """Analyze audio quality metrics."""
     metrics = QualityMetrics()
@@ -373,32 +533,38 @@ def analyze_quality(audio: np.ndarray) -> QualityMetrics:
     if len(audio) == 0:
         return metrics
 
-    # Peak and RMS
-    metrics.peak_amplitude = float(np.max(np.abs(audio)))
-    metrics.rms_level = float(np.sqrt(np.mean(audio ** 2)))
+    # One contiguous float32 buffer shared by every metric below (a no-op
+    # for load_audio output; keeps numba on a single specialization)
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
 
-    # DC offset
-    metrics.dc_offset = float(np.mean(audio))
-
-    # Clipping detection (>= 0.99)
-    clip_count = np.sum(np.abs(audio) >= 0.99)
-    metrics.clipping_percent = float(100.0 * clip_count / len(audio))
+    # Peak, RMS, DC offset and clipping (>= 0.99) from a single pass
+    n = len(audio)
+    total, sum_sq, peak, clip_count = fused_audio_stats(audio)
+    metrics.peak_amplitude = float(peak)
+    metrics.rms_level = float(np.sqrt(sum_sq / n))
+    metrics.dc_offset = float(total / n)
+    metrics.clipping_percent = float(100.0 * clip_count / n)
 
     # THD estimation (simplified - based on spectral analysis)
     if HAS_SCIPY:
         try:
-            freqs, psd = signal.welch(audio, fs=SAMPLE_RATE, nperseg=4096)
+            freqs, psd = _get_scipy_signal().welch(
+                audio, fs=SAMPLE_RATE, window=_get_window('hann', WELCH_NPERSEG),
+                nperseg=WELCH_NPERSEG
+            )
             if np.max(psd) > 0:
                 # Find fundamental peak
-                peak_idx = np.argmax(psd)
+                peak_idx = int(np.argmax(psd))
                 fundamental_power = psd[peak_idx]
 
-                # Sum harmonic power (simplified)
-                harmonic_power = 0.0
-                for h in range(2, 8):
-                    harmonic_idx = int(peak_idx * h)
-                    if harmonic_idx < len(psd):
-                        harmonic_power += psd[harmonic_idx]
+                # Sum power of harmonics 2-7, taking the strongest of the
+                # +/-1 neighbouring bins to absorb spectral leakage (never
+                # reaching back to the fundamental bin itself)
+                harmonic_idx = peak_idx * np.arange(2, 8)
+                harmonic_idx = harmonic_idx[harmonic_idx < len(psd)]
+                bins = np.clip(harmonic_idx[:, None] + np.arange(-1, 2),
+                               peak_idx + 1, len(psd) - 1)
+                harmonic_power = psd[bins].max(axis=1).sum()
 
                 if fundamental_power > 0:
                     metrics.thd_percent = float(100.0 * np.sqrt(harmonic_power / fundamental_power))
@@ -406,12 +572,22 @@ def analyze_quality(audio: np.ndarray) -> QualityMetrics:
             pass
 
     # HNR estimation (simplified)
-    if HAS_SCIPY and metrics.rms_level > 0.01:
+    if metrics.rms_level > 0.01:
         try:
-            # Use autocorrelation-based approach
-            corr = signal.correlate(audio[:SAMPLE_RATE], audio[:SAMPLE_RATE], mode='full')
-            corr = corr[len(corr)//2:]
-            peak_idx = np.argmax(corr[100:]) + 100  # Skip DC area
+            # Autocorrelation of the first HNR_WINDOW samples via FFT
+            # (zero-padded to 2x so the circular result has no wrap-around)
+            window = audio[:HNR_WINDOW]
+            n_win = len(window)
+            spectrum = np.fft.rfft(window, n=2 * n_win)
+            corr = np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2)
+            corr = corr[:min(HNR_MAX_LAG, n_win)]  # positive lags only
+            # Rescale lag overlap from the short window to a 1 s window so
+            # the dB figures stay comparable with the full-length estimate
+            n_ref = min(len(audio), SAMPLE_RATE)
+            lags = np.arange(len(corr))
+            corr *= n_win * (n_ref - lags) / (n_ref * (n_win - lags))
+            # Skip DC area; search pitch periods down to ~48 Hz
+            peak_idx = np.argmax(corr[HNR_MIN_LAG:]) + HNR_MIN_LAG
             if peak_idx > 0 and corr[0] > 0:
                 hnr = corr[peak_idx] / (corr[0] - corr[peak_idx] + 1e-10)
                 if hnr > 0:
@@ -426,24 +602,93 @@ def analyze_quality(audio: np.ndarray) -> QualityMetrics:
 # Visualization Generation
 # =============================================================================
 
-def generate_spectrogram(audio: np.ndarray, output_path: Path, title: str = "") -> bool:
-    """Generate spectrogram image."""
+# One figure per plot type, reused across modules. Kept per thread, since
+# the thread executor runs several modules' plots in one process at once.
+_FIG_CACHE = threading.local()
+
+
+def _get_figure(kind: str, figsize: tuple[float, float]):
+    """Get a cleared, cached figure (this thread's own) with a single fresh axes."""
+    figs = getattr(_FIG_CACHE, "figs", None)
+    if figs is None:
+        figs = _FIG_CACHE.figs = {}
+    key = (kind, figsize)
+    fig = figs.get(key)
+    if fig is None:
+        fig = figs[key] = _get_plt().figure(figsize=figsize)
+    else:
+        fig.clf()
+    return fig, fig.add_subplot()
+
+
+def save_palette_png(fig, output_path: Path, **savefig_kwargs):
+    """Save a figure as an 8-bit palette PNG.
+
+    Colormapped plots use far fewer than 256 distinct colors, so quantizing
+    the RGBA render loses nothing visible and roughly halves file size.
+    """
+    from PIL import Image  # always available: matplotlib depends on Pillow
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', **savefig_kwargs)
+    buf.seek(0)
+    with Image.open(buf) as img:
+        img.convert('RGB').quantize(256, method=Image.Quantize.FASTOCTREE).save(
+            output_path, format='png', optimize=True
+        )
+
+
+def _spectrogram_db(audio: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Spectrogram of the displayed band in dB, as (freqs, times, Sxx_db)."""
+    # Resample to SPEC_RATE (Nyquist = plot limit) before the STFT
+    g = math.gcd(SPEC_RATE, SAMPLE_RATE)
+    signal = _get_scipy_signal()
+    audio = signal.resample_poly(audio, SPEC_RATE // g, SAMPLE_RATE // g)
+    f, t, Sxx = signal.spectrogram(
+        audio, fs=SPEC_RATE, window=_get_window(('tukey', 0.25), SPEC_NPERSEG),
+        nperseg=SPEC_NPERSEG, noverlap=SPEC_NOVERLAP
+    )
+
+    # Convert to dB scale
+    return f, t, 10 * np.log10(Sxx + 1e-10)
+
+
+def _save_spectrogram_raster(Sxx_db: np.ndarray, output_path: Path):
+    """Write a spectrogram straight to PNG: one pixel per STFT bin, no axes."""
+    from matplotlib import colormaps
+    from PIL import Image  # always available: matplotlib depends on Pillow
+
+    # Same -80..0 dB magma scale as the plotted version, low frequencies at
+    # the bottom
+    level = np.clip((Sxx_db[::-1] + 80.0) / 80.0, 0.0, 1.0)
+    rgba = colormaps['magma'](level, bytes=True)
+    Image.fromarray(rgba[..., :3]).save(output_path, format='png', compress_level=1)
+
+
+def generate_spectrogram(audio: np.ndarray, output_path: Path, title: str = "",
+                         fast: bool = False) -> bool:
+    """Generate spectrogram image.
+
+    With fast=True the colormapped spectrogram is written directly as an
+    image, skipping the matplotlib figure (axes, labels, colorbar).
+    """
     if not HAS_MATPLOTLIB or not HAS_SCIPY:
         return False
 
     try:
-        fig, ax = plt.subplots(figsize=(12, 4))
+        f, t, Sxx_db = _spectrogram_db(audio)
+        if fast:
+            _save_spectrogram_raster(Sxx_db, output_path)
+            return True
 
-        # Generate spectrogram
-        f, t, Sxx = signal.spectrogram(
-            audio, fs=SAMPLE_RATE, nperseg=2048, noverlap=1536
-        )
-
-        # Convert to dB scale
-        Sxx_db = 10 * np.log10(Sxx + 1e-10)
+        fig, ax = _get_figure('spectrogram', (12, 4))
 
         # Plot
-        im = ax.pcolormesh(t, f, Sxx_db, shading='gouraud', cmap='magma', vmin=-80, vmax=0)
+        # (regular grid, so a bilinear image looks the same as a gouraud
+        # mesh at this size and renders much faster)
+        im = ax.imshow(Sxx_db, aspect='auto', origin='lower',
+                       extent=[t[0], t[-1], f[0], f[-1]], cmap='magma',
+                       vmin=-80, vmax=0, interpolation='bilinear')
         ax.set_ylabel('Frequency [Hz]')
         ax.set_xlabel('Time [s]')
         ax.set_ylim([0, 8000])  # Focus on audible range
@@ -452,8 +697,7 @@ def generate_spectrogram(audio: np.ndarray, output_path: Path, title: str = "")
 
         fig.colorbar(im, ax=ax, label='dB')
         fig.tight_layout()
-        fig.savefig(output_path, dpi=100, bbox_inches='tight')
-        plt.close(fig)
+        save_palette_png(fig, output_path, dpi=100, bbox_inches='tight')
         return True
     except Exception as e:
         warnings.warn(f"Error generating spectrogram: {e}")
@@ -470,7 +714,7 @@ def generate_automation_graph(showcase: ShowcaseConfig, output_path: Path,
         return False
 
     try:
-        fig, ax = plt.subplots(figsize=(12, 3))
+        fig, ax = _get_figure('automation', (12, 3))
         ax.set_facecolor('#1a1a2e')
         fig.patch.set_facecolor('#1a1a2e')
 
@@ -518,9 +762,6 @@ def generate_automation_graph(showcase: ShowcaseConfig, output_path: Path,
 
             color = colors[param_idx % len(colors)]
 
-            # Build the full timeline for this parameter
-            values = np.zeros_like(t_full)
-
             # Find automations for this param
             param_autos = [a for a in showcase.automations if a.param == auto.param]
 
@@ -535,19 +776,18 @@ def generate_automation_graph(showcase: ShowcaseConfig, output_path: Path,
                             init_val = (p.get('init', 0.5) - min_v) / (max_v - min_v)
                         break
 
-            # Build value array
-            for i, t in enumerate(t_full):
-                value = init_val  # Start with initial
-                for a in param_autos:
-                    if a.start_time <= t <= a.end_time:
-                        # Linear interpolation within automation range
-                        progress = (t - a.start_time) / (a.end_time - a.start_time)
-                        value = a.start_value + (a.end_value - a.start_value) * progress
-                        break
-                    elif t > a.end_time:
-                        # After automation, hold final value
-                        value = a.end_value
-                values[i] = value
+            # Build value array: the first automation covering a time point
+            # wins; before that, any automation that has already ended holds
+            # its final value over the initial one
+            values = np.full_like(t_full, init_val)
+            settled = np.zeros(t_full.shape, dtype=bool)
+            for a in param_autos:
+                values[~settled & (t_full > a.end_time)] = a.end_value
+                active = ~settled & (t_full >= a.start_time) & (t_full <= a.end_time)
+                span = a.end_time - a.start_time
+                progress = (t_full[active] - a.start_time) / span if span > 0 else 1.0
+                values[active] = a.start_value + (a.end_value - a.start_value) * progress
+                settled |= active
 
             ax.plot(t_full, values, color=color, linewidth=2, label=auto.param)
             ax.fill_between(t_full, 0, values, color=color, alpha=0.15)
@@ -577,7 +817,6 @@ def generate_automation_graph(showcase: ShowcaseConfig, output_path: Path,
 
         fig.tight_layout()
         fig.savefig(output_path, dpi=100, bbox_inches='tight', facecolor='#1a1a2e')
-        plt.close(fig)
         return True
     except Exception as e:
         warnings.warn(f"Error generating automation graph: {e}")
@@ -593,7 +832,7 @@ def generate_note_score(showcase: ShowcaseConfig, output_path: Path, title: str
         return False
 
     try:
-        fig, ax = plt.subplots(figsize=(12, 2.5))
+        fig, ax = _get_figure('note_score', (12, 2.5))
         ax.set_facecolor('#1a1a2e')
         fig.patch.set_facecolor('#1a1a2e')
 
@@ -602,26 +841,27 @@ def generate_note_score(showcase: ShowcaseConfig, output_path: Path, title: str
         min_volts = min(all_volts) - 0.5
         max_volts = max(all_volts) + 0.5
 
-        # Draw piano roll style
+        # Draw piano roll style: all note rectangles as one collection,
+        # with per-note opacity from velocity
+        from matplotlib.collections import PatchCollection
+        from matplotlib.colors import to_rgba
+        plt = _get_plt()
+        alphas = np.clip([0.7 + 0.3 * note.velocity for note in showcase.notes], 0.0, 1.0)
+        facecolors = np.tile(to_rgba('#4ecdc4'), (len(alphas), 1))
+        edgecolors = np.tile(to_rgba('#2a9d8f'), (len(alphas), 1))
+        facecolors[:, 3] = edgecolors[:, 3] = alphas
+        ax.add_collection(PatchCollection(
+            [plt.Rectangle((note.start, note.volts - 0.15), note.duration, 0.3)
+             for note in showcase.notes],
+            facecolors=facecolors, edgecolors=edgecolors, linewidths=1.5
+        ))
+
+        # Note labels
         for note in showcase.notes:
-            # Rectangle for each note
-            rect = plt.Rectangle(
-                (note.start, note.volts - 0.15),
-                note.duration,
-                0.3,
-                facecolor='#4ecdc4',
-                edgecolor='#2a9d8f',
-                linewidth=1.5,
-                alpha=0.7 + 0.3 * note.velocity
-            )
-            ax.add_patch(rect)
-
-            # Note label
-            note_name = volts_to_note_name(note.volts)
             ax.text(
                 note.start + note.duration / 2,
                 note.volts,
-                note_name,
+                volts_to_note_name(note.volts),
                 ha='center', va='center',
                 fontsize=9, fontweight='bold',
                 color='#fff'
@@ -648,7 +888,6 @@ def generate_note_score(showcase: ShowcaseConfig, output_path: Path, title: str
 
         fig.tight_layout()
         fig.savefig(output_path, dpi=100, bbox_inches='tight', facecolor='#1a1a2e')
-        plt.close(fig)
         return True
     except Exception as e:
         warnings.warn(f"Error generating note score: {e}")
@@ -703,17 +942,7 @@ def run_ai_analysis(wav_path: Path, module_name: str, showcase_context: str,
 
         # Extract CLAP results
         if ai_result.clap_scores:
-            result.clap_quality_score = ai_result.clap_scores.quality_score
-            # Get top character traits
-            if ai_result.clap_scores.character_scores:
-                sorted_chars = sorted(
-                    ai_result.clap_scores.character_scores.items(),
-                    key=lambda x: x[1], reverse=True
-                )
-                result.clap_character = [c[0] for c in sorted_chars[:5]]
-            # Get detected sounds from top positive matches
-            if ai_result.clap_scores.top_positive:
-                result.detected_sounds = [d[0] for d in ai_result.clap_scores.top_positive[:3]]
+            apply_clap_scores(result, ai_result.clap_scores)
 
         # Extract Gemini results
         if ai_result.gemini_analysis:
@@ -729,51 +958,133 @@ def run_ai_analysis(wav_path: Path, module_name: str, showcase_context: str,
     return result, gemini_text
 
 
+def apply_clap_scores(result: AIAnalysis, clap_scores) -> None:
+    """Copy the report-relevant parts of CLAPScores into an AIAnalysis."""
+    result.clap_quality_score = clap_scores.quality_score
+    # Get top character traits
+    if clap_scores.character_scores:
+        sorted_chars = sorted(
+            clap_scores.character_scores.items(),
+            key=lambda x: x[1], reverse=True
+        )
+        result.clap_character = [c[0] for c in sorted_chars[:5]]
+    # Get detected sounds from top positive matches
+    if clap_scores.top_positive:
+        result.detected_sounds = [d[0] for d in clap_scores.top_positive[:3]]
+
+
+def run_clap_batch(reports: list[ModuleReport], verbose: bool = False,
+                   batch_size: int = 8) -> None:
+    """Run CLAP on every rendered showcase in batched forward passes.
+
+    Text embeddings are computed once and audio is encoded batch_size files
+    at a time, instead of loading the model and encoding per module.
+    """
+    targets = [r for r in reports
+               if r.showcase_wav and r.status not in ("skip", "error")]
+    if not targets:
+        return
+
+    try:
+        from ai_audio_analysis import HAS_CLAP, analyze_with_clap_batch
+    except ImportError:
+        if verbose:
+            print("    AI analysis not available (missing dependencies)")
+        return
+
+    if not HAS_CLAP:
+        if verbose:
+            print("    CLAP: disabled")
+        return
+
+    try:
+        scores = analyze_with_clap_batch([r.showcase_wav for r in targets],
+                                         batch_size=batch_size)
+    except Exception as e:
+        if verbose:
+            print(f"CLAP analysis error: {e}")
+        return
+
+    for report, clap_scores in zip(targets, scores):
+        if clap_scores:
+            apply_clap_scores(report.ai, clap_scores)
+
+
 # =============================================================================
 # HTML Report Generation
 # =============================================================================
 
+# html.escape for CLAP character tags, which recur across cards; report
+# text fields are escaped once on the ModuleReport itself
+_escape = functools.lru_cache(maxsize=4096)(html.escape)
+
+# Pre-rendered status badges; colors come from the .status-badge rules in
+# the report CSS
+_STATUS_BADGES: dict[str, str] = {
+    status: (f'<span class="status-badge {status.replace("_", "-")}">'
+             f'{status.upper().replace("_", " ")}</span>')
+    for status in ("pass", "needs_work", "skip", "pending", "error")
+}
+# The TOC dots only distinguish pass / needs work; everything else is grey
+_TOC_STATUS_COLORS: dict[str, str] = {
+    "pass": "#28a745",
+    "needs_work": "#ffc107",
+    "skip": "#6c757d",
+}
+
+
 def get_status_badge(status: str) -> str:
     """Get HTML badge for status."""
-    colors = {
-        "pass": "#28a745",
-        "needs_work": "#ffc107",
-        "skip": "#6c757d",
-        "pending": "#17a2b8",
-        "error": "#dc3545",
-    }
-    color = colors.get(status, "#6c757d")
-    label = status.upper().replace("_", " ")
-    return f'<span class="status-badge" style="background:{color};">{label}</span>'
+    badge = _STATUS_BADGES.get(status)
+    if badge is None:
+        badge = f'<span class="status-badge">{status.upper().replace("_", " ")}</span>'
+    return badge
+
+
+# Metric badge classes: bad, warning, good
+_METRIC_CLASSES = ("metric-bad", "metric-warn", "metric-good")
 
 
 def get_metric_badge(value: float, good_threshold: float, bad_threshold: float,
                      unit: str = "", higher_is_better: bool = True) -> str:
     """Get HTML badge for a metric value."""
     if higher_is_better:
-        if value >= good_threshold:
-            color = "#28a745"
-        elif value >= bad_threshold:
-            color = "#ffc107"
-        else:
-            color = "#dc3545"
+        good, ok = value >= good_threshold, value >= bad_threshold
     else:
-        if value <= good_threshold:
-            color = "#28a745"
-        elif value <= bad_threshold:
-            color = "#ffc107"
-        else:
-            color = "#dc3545"
+        good, ok = value <= good_threshold, value <= bad_threshold
+    css_class = _METRIC_CLASSES[2 if good else ok]
+
+    return f'<span class="{css_class}">{value:.1f}{unit}</span>'
+
 
-    return f'<span style="color:{color};font-weight:bold;">{value:.1f}{unit}</span>'
+# Read size for streaming base64 encoding; a multiple of 3 so no padding
+# appears between chunks
+B64_CHUNK_SIZE = 57 * 1024
+
+
+def _encode_file_base64(path: Path) -> str:
+    """Base64-encode a file in fixed-size chunks.
+
+    The file is memory-mapped and encoded straight from memoryview slices,
+    so no intermediate bytes copy of the file is made.
+    """
+    parts = []
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                for start in range(0, len(view), B64_CHUNK_SIZE):
+                    chunk = view[start:start + B64_CHUNK_SIZE]
+                    parts.append(base64.b64encode(chunk).decode("ascii"))
+                    chunk.release()
+    return "".join(parts)
 
 
 def encode_audio_base64(wav_path: Path) -> str | None:
     """Encode WAV file as base64 for inline audio player."""
     try:
-        with open(wav_path, "rb") as f:
-            data = f.read()
-        return base64.b64encode(data).decode('utf-8')
+        return _encode_file_base64(wav_path)
     except Exception:
         return None
 
@@ -781,22 +1092,57 @@ def encode_audio_base64(wav_path: Path) -> str | None:
 def encode_image_base64(img_path: Path) -> str | None:
     """Encode image as base64 for inline display."""
     try:
-        with open(img_path, "rb") as f:
-            data = f.read()
-        return base64.b64encode(data).decode('utf-8')
+        return _encode_file_base64(img_path)
     except Exception:
         return None
 
 
+def report_asset_preparer(output_path: Path, config: ReportConfig):
+    """Function turning a report into the assets its card embeds or links."""
+    if config.inline_assets:
+        return encode_report_assets
+    return functools.partial(export_report_assets,
+                             assets_dir=output_path.parent / "assets")
+
+
+class CardSpool:
+    """Module cards rendered as their reports complete.
+
+    Cards are written to a temporary directory (they carry the base64
+    payloads, so are not kept in memory) while the remaining modules are
+    still processing, and copied into the report in name order at the end.
+    Only valid when nothing modifies the reports after processing, i.e.
+    without the CLAP batch pass.
+    """
+
+    def __init__(self, output_path: Path, config: ReportConfig):
+        self.config = config
+        self.prepare_assets = report_asset_preparer(output_path, config)
+        self.paths: dict[str, Path] = {}
+        self._dir = tempfile.TemporaryDirectory(prefix="unified-report-cards-")
+
+    def add(self, report: ModuleReport):
+        path = Path(self._dir.name) / f"{len(self.paths)}.html"
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(generate_module_card_chunks(
+                report, self.config, self.prepare_assets(report)))
+        self.paths[report.module_name] = path
+
+    def close(self):
+        self._dir.cleanup()
+
+
 def generate_html_report(reports: list[ModuleReport], output_path: Path,
-                         config: ReportConfig):
-    """Generate consolidated HTML report."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                         config: ReportConfig, spool: CardSpool | None = None):
+    """Generate consolidated HTML report.
+
+    Cards already rendered into ``spool`` are copied in as-is; the rest are
+    rendered here.
+    """
+    timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
 
     # Count statuses
-    status_counts = {"pass": 0, "needs_work": 0, "skip": 0, "error": 0}
-    for r in reports:
-        status_counts[r.status] = status_counts.get(r.status, 0) + 1
+    status_counts = Counter(r.status for r in reports)
 
     # Determine mode label
     if config.skip_clap and config.skip_gemini:
@@ -809,24 +1155,34 @@ def generate_html_report(reports: list[ModuleReport], output_path: Path,
     # Build table of contents
     toc_items = []
     for report in reports:
-        status_color = {"pass": "#28a745", "needs_work": "#ffc107", "skip": "#6c757d"}.get(report.status, "#6c757d")
+        status_color = _TOC_STATUS_COLORS.get(report.status, "#6c757d")
         toc_items.append(
             f'<a href="#module-{report.module_name}" class="toc-item">'
             f'<span class="toc-status" style="background:{status_color};"></span>'
-            f'{report.module_name} <span class="toc-type">({report.module_type})</span></a>'
+            f'{report.module_name_html} <span class="toc-type">({report.module_type_html})</span></a>'
         )
     toc_html = "\n".join(toc_items)
 
-    # Generate CSS
-    css = generate_report_css()
+    if config.external_assets:
+        # Shared stylesheet and script next to the report, cacheable
+        # across reports written to the same directory
+        output_path.parent.joinpath("report.css").write_text(
+            generate_report_css(), encoding="utf-8")
+        output_path.parent.joinpath("report.js").write_text(
+            _REPORT_JS, encoding="utf-8")
+        style_html = '<link rel="stylesheet" href="report.css">'
+        script_html = '<script src="report.js"></script>'
+    else:
+        style_html = f"<style>{generate_report_css()}</style>"
+        script_html = f"<script>{_REPORT_JS}    </script>"
 
-    html_content = f"""<!DOCTYPE html>
+    html_head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>WiggleRoom Audio Report - PR Review</title>
-    <style>{css}</style>
+    {style_html}
 </head>
 <body>
     <div class="header">
@@ -850,54 +1206,49 @@ def generate_html_report(reports: list[ModuleReport], output_path: Path,
     </div>
 """
 
-    for report in reports:
-        html_content += generate_module_card_html(report, config)
-
-    html_content += """
-    <script>
-    function loadAudio(button) {
-        const container = button.parentElement;
-        const audioWrapper = container.querySelector('.audio-wrapper');
-        const audio = audioWrapper.querySelector('audio');
-        const src = button.dataset.src;
-
-        button.classList.add('loading');
-        button.querySelector('.status-text').textContent = 'Loading...';
-
-        audio.oncanplaythrough = function() {
-            button.classList.add('loaded');
-            audioWrapper.classList.add('loaded');
-            audio.play();
-        };
-
-        audio.onerror = function() {
-            button.classList.remove('loading');
-            button.querySelector('.status-text').textContent = 'Failed to load';
-            button.style.color = '#ff6b6b';
-        };
-
-        audio.src = src;
-        audio.load();
-    }
-
-    function toggleSection(id) {
-        const section = document.getElementById(id);
-        if (section) {
-            section.classList.toggle('hidden');
-        }
-    }
-    </script>
+    html_foot = f"""
+    {script_html}
 </body>
 </html>
 """
 
-    output_path.write_text(html_content)
+    # Stream module cards straight to the file (through a 1 MiB buffer)
+    # rather than concatenating the whole asset-heavy report in memory.
+    # Asset encoding (or copying, without inline_assets) is file I/O plus
+    # C-level base64, so it runs on a thread pool ahead of the writer.
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool, \
+            open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        spooled = spool.paths if spool is not None else {}
+        prepare_assets = report_asset_preparer(output_path, config)
+        to_encode = iter([r for r in reports if r.module_name not in spooled])
+        # Keep at most two modules per worker encoded ahead of the writer,
+        # so finished payloads waiting to be written stay bounded
+        in_flight = deque()
+
+        def submit_next():
+            report = next(to_encode, None)
+            if report is not None:
+                in_flight.append(pool.submit(prepare_assets, report))
+
+        for _ in range(2 * max_workers):
+            submit_next()
+
+        f.write(html_head)
+        for report in reports:
+            card_path = spooled.get(report.module_name)
+            if card_path is not None:
+                with open(card_path, encoding="utf-8") as card:
+                    shutil.copyfileobj(card, f, 1 << 20)
+            else:
+                assets = in_flight.popleft().result()
+                submit_next()
+                f.writelines(generate_module_card_chunks(report, config, assets))
+        f.write(html_foot)
     print(f"Report written to: {output_path}")
 
 
-def generate_report_css() -> str:
-    """Generate CSS for the report."""
-    return """
+_REPORT_CSS = """
         * { box-sizing: border-box; }
         body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
@@ -937,12 +1288,18 @@ def generate_report_css() -> str:
         .status-count.needs-work { background: rgba(255, 193, 7, 0.2); color: #ffc107; }
         .status-count.skip { background: rgba(108, 117, 125, 0.2); color: #6c757d; }
         .status-badge {
+            background: #6c757d;
             color: white;
             padding: 3px 10px;
             border-radius: 4px;
             font-size: 12px;
             font-weight: bold;
         }
+        .status-badge.pass { background: #28a745; }
+        .status-badge.needs-work { background: #ffc107; }
+        .status-badge.skip { background: #6c757d; }
+        .status-badge.pending { background: #17a2b8; }
+        .status-badge.error { background: #dc3545; }
         .module-card {
             background: #16213e;
             border-radius: 12px;
@@ -990,6 +1347,10 @@ def generate_report_css() -> str:
         }
         .metric-row:last-child { border-bottom: none; }
         .metric-label { color: #888; }
+        .metric-good, .metric-warn, .metric-bad { font-weight: bold; }
+        .metric-good { color: #28a745; }
+        .metric-warn { color: #ffc107; }
+        .metric-bad { color: #dc3545; }
         .ai-section { margin-top: 16px; }
         .ai-section h4 { margin: 0 0 8px 0; font-size: 13px; color: #aaa; }
         .character-tags { display: flex; flex-wrap: wrap; gap: 4px; }
@@ -1139,33 +1500,134 @@ def generate_report_css() -> str:
     """
 
 
-def generate_module_card_html(report: ModuleReport, config: ReportConfig) -> str:
+def generate_report_css() -> str:
+    """Generate CSS for the report."""
+    return _REPORT_CSS
+
+
+_REPORT_JS = """
+    function loadAudio(button) {
+        const container = button.parentElement;
+        const audioWrapper = container.querySelector('.audio-wrapper');
+        const audio = audioWrapper.querySelector('audio');
+        const src = button.dataset.src;
+
+        button.classList.add('loading');
+        button.querySelector('.status-text').textContent = 'Loading...';
+
+        audio.oncanplaythrough = function() {
+            button.classList.add('loaded');
+            audioWrapper.classList.add('loaded');
+            audio.play();
+        };
+
+        audio.onerror = function() {
+            button.classList.remove('loading');
+            button.querySelector('.status-text').textContent = 'Failed to load';
+            button.style.color = '#ff6b6b';
+        };
+
+        audio.src = src;
+        audio.load();
+    }
+
+    function toggleSection(id) {
+        const section = document.getElementById(id);
+        if (section) {
+            section.classList.toggle('hidden');
+        }
+    }
+"""
+
+
+# Embedded media per report: asset key -> (ModuleReport attribute, MIME type)
+_REPORT_ASSETS = {
+    "audio": ("showcase_wav", "audio/wav"),
+    "spectrogram": ("spectrogram", "image/png"),
+    "automation": ("automation_graph", "image/png"),
+    "notes": ("note_score", "image/png"),
+}
+
+
+def encode_report_assets(report: ModuleReport) -> dict[str, tuple[str, str]]:
+    """Encode a report's audio and images as base64 data URIs.
+
+    Each asset maps to a ``(prefix, payload)`` pair whose concatenation is
+    the ``src`` URL; missing or unreadable files map to ``("", "")``.
+    """
+    assets = {}
+    for key, (attr, mime) in _REPORT_ASSETS.items():
+        path = getattr(report, attr)
+        payload = ""
+        if path and path.exists():
+            encoder = encode_audio_base64 if key == "audio" else encode_image_base64
+            payload = encoder(path) or ""
+        assets[key] = (f"data:{mime};base64,", payload) if payload else ("", "")
+    return assets
+
+
+def export_report_assets(report: ModuleReport,
+                         assets_dir: Path) -> dict[str, tuple[str, str]]:
+    """Copy a report's audio and images under assets_dir/<module>/.
+
+    Returns the same mapping as encode_report_assets, with ``src`` URLs
+    relative to the directory containing assets_dir.
+    """
+    module_dir = assets_dir / report.module_name
+    assets = {}
+    for key, (attr, _) in _REPORT_ASSETS.items():
+        path = getattr(report, attr)
+        assets[key] = ("", "")
+        if not (path and path.exists()):
+            continue
+        try:
+            module_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, module_dir / path.name)
+        except OSError:
+            continue
+        assets[key] = ("", f"{quote(assets_dir.name)}/{quote(report.module_name)}/"
+                           f"{quote(path.name)}")
+    return assets
+
+
+@functools.lru_cache(maxsize=None)
+def _read_clean_svg(svg_path: Path, mtime: float) -> str:
+    """Read a panel SVG for inline embedding (cached per path and mtime)."""
+    svg = svg_path.read_text()
+    # Clean up SVG for embedding (remove XML declaration if present)
+    if svg.startswith("<?xml") and "?>" in svg:
+        svg = svg[svg.index("?>") + 2:].strip()
+    return svg
+
+
+def generate_module_card_html(report: ModuleReport, config: ReportConfig,
+                              assets: dict[str, tuple[str, str]] | None = None) -> str:
     """Generate HTML for a single module card."""
-    # Encode audio and images as base64 for inline embedding
-    audio_b64 = ""
-    if report.showcase_wav and report.showcase_wav.exists():
-        audio_b64 = encode_audio_base64(report.showcase_wav) or ""
+    return "".join(generate_module_card_chunks(report, config, assets))
 
-    spectrogram_b64 = ""
-    if report.spectrogram and report.spectrogram.exists():
-        spectrogram_b64 = encode_image_base64(report.spectrogram) or ""
 
-    automation_b64 = ""
-    if report.automation_graph and report.automation_graph.exists():
-        automation_b64 = encode_image_base64(report.automation_graph) or ""
+def generate_module_card_chunks(report: ModuleReport, config: ReportConfig,
+                                assets: dict[str, tuple[str, str]] | None = None) -> list[str]:
+    """Generate the HTML fragments for a single module card, in order.
 
-    notes_b64 = ""
-    if report.note_score and report.note_score.exists():
-        notes_b64 = encode_image_base64(report.note_score) or ""
+    ``assets`` takes the media sources from encode_report_assets or
+    export_report_assets; they are encoded inline here when not given.
+    The (possibly multi-MB) payloads are separate elements so a writer can
+    emit them directly without copying them into a joined card string.
+    """
+    if assets is None:
+        assets = encode_report_assets(report)
+    audio_src = assets["audio"]
+    spectrogram_src = assets["spectrogram"]
+    automation_src = assets["automation"]
+    notes_src = assets["notes"]
 
     # Load SVG panel content (not base64, just embed inline)
     panel_svg_content = ""
-    if report.panel_svg and report.panel_svg.exists():
+    if report.panel_svg:
         try:
-            panel_svg_content = report.panel_svg.read_text()
-            # Clean up SVG for embedding (remove XML declaration if present)
-            if panel_svg_content.startswith("<?xml"):
-                panel_svg_content = panel_svg_content[panel_svg_content.index("?>") + 2:].strip()
+            panel_svg_content = _read_clean_svg(
+                report.panel_svg, report.panel_svg.stat().st_mtime)
         except Exception:
             pass
 
@@ -1188,7 +1650,7 @@ def generate_module_card_html(report: ModuleReport, config: ReportConfig) -> str
                 <span>{report.ai.clap_quality_score:.0f}/100</span>
             </div>
             <div class="character-tags">
-                {"".join(f'<span class="character-tag">{html.escape(c)}</span>' for c in report.ai.clap_character[:5])}
+                {"".join(f'<span class="character-tag">{_escape(c)}</span>' for c in report.ai.clap_character[:5])}
             </div>
         </div>
         """
@@ -1204,27 +1666,11 @@ def generate_module_card_html(report: ModuleReport, config: ReportConfig) -> str
                 Toggle Details
             </button>
             <div id="gemini-{module_id}" class="gemini-content">
-{html.escape(report.gemini_analysis)}
+{report.gemini_analysis_html}
             </div>
         </div>
         """
 
-    # Panel SVG section
-    panel_html = ""
-    if panel_svg_content:
-        panel_html = f"""<div class="panel-svg">{panel_svg_content}</div>"""
-
-    # Issues section
-    issues_html = ""
-    if report.issues:
-        issues_html = f"""
-        <div class="issues">
-            <ul>
-                {"".join(f'<li>{html.escape(issue)}</li>' for issue in report.issues)}
-            </ul>
-        </div>
-        """
-
     # Parameter grid section (if full mode)
     param_grid_html = ""
     if config.include_param_grid and report.param_permutations:
@@ -1241,42 +1687,49 @@ def generate_module_card_html(report: ModuleReport, config: ReportConfig) -> str
         </div>
         """
 
-    # Build visualizations HTML
-    vis_html = ""
-    if spectrogram_b64:
-        vis_html += f"<img class='spectrogram' src='data:image/png;base64,{spectrogram_b64}' alt='Spectrogram'>"
-    if notes_b64:
-        vis_html += f"<img class='spectrogram' src='data:image/png;base64,{notes_b64}' alt='Note Score' style='margin-top:8px;'>"
-    if automation_b64:
-        vis_html += f"<img class='spectrogram' src='data:image/png;base64,{automation_b64}' alt='Parameter Automation' style='margin-top:8px;'>"
-
-    # Audio player
-    audio_html = ""
-    if audio_b64:
-        audio_html = f"<audio controls><source src='data:audio/wav;base64,{audio_b64}' type='audio/wav'></audio>"
-    else:
-        audio_html = "<p style='color:#888;'>No audio available</p>"
-
-    return f"""
+    # Assemble the card as a list of chunks; the base64 payloads go in as
+    # their own elements so they are never copied into a larger string
+    img_open = "<img class='spectrogram' loading='lazy' decoding='async' src='"
+    vis_parts = []
+    if spectrogram_src[1]:
+        vis_parts.extend((img_open, *spectrogram_src, "' alt='Spectrogram'>"))
+    if notes_src[1]:
+        vis_parts.extend((img_open, *notes_src, "' alt='Note Score' style='margin-top:8px;'>"))
+    if automation_src[1]:
+        vis_parts.extend((img_open, *automation_src, "' alt='Parameter Automation' style='margin-top:8px;'>"))
+    if not vis_parts:
+        vis_parts.append("<p style='color:#888;'>No visualizations available</p>")
+
+    chunks = [f"""
     <div class="module-card" id="module-{report.module_name}">
         <div class="module-header">
             <div>
-                <h2>{html.escape(report.module_name)}</h2>
-                <span class="module-type">{html.escape(report.module_type)} | {report.duration:.1f}s</span>
+                <h2>{report.module_name_html}</h2>
+                <span class="module-type">{report.module_type_html} | {report.duration:.1f}s</span>
             </div>
             {get_status_badge(report.status)}
         </div>
         <div class="panel-section">
-            {panel_html}
+            """]
+    if panel_svg_content:
+        chunks.extend(('<div class="panel-svg">', panel_svg_content, "</div>"))
+    chunks.append(f"""
             <div style="flex:1;">
-                <p style="color:#888;margin:0 0 8px 0;font-size:14px;">{html.escape(report.description)}</p>
+                <p style="color:#888;margin:0 0 8px 0;font-size:14px;">{report.description_html}</p>
             </div>
         </div>
         <div class="module-content">
             <div class="audio-section">
                 <h3>Showcase Audio</h3>
-                {audio_html}
-                {vis_html if vis_html else "<p style='color:#888;'>No visualizations available</p>"}
+                """)
+    if audio_src[1]:
+        chunks.extend(("<audio controls><source src='", *audio_src,
+                       "' type='audio/wav'></audio>"))
+    else:
+        chunks.append("<p style='color:#888;'>No audio available</p>")
+    chunks.append("\n                ")
+    chunks.extend(vis_parts)
+    chunks.append(f"""
             </div>
             <div class="metrics-section">
                 <h3>Quality Metrics</h3>
@@ -1305,13 +1758,31 @@ def generate_module_card_html(report: ModuleReport, config: ReportConfig) -> str
                     {dc_badge}
                 </div>
                 {ai_html}
-                {issues_html}
+                """)
+    if report.issues:
+        chunks.append("""
+        <div class="issues">
+            <ul>
+                """)
+        chunks.extend(f'<li>{issue}</li>' for issue in report.issues_html)
+        chunks.append("""
+            </ul>
+        </div>
+        """)
+    chunks.append("""
             </div>
         </div>
-        {param_grid_html}
-        {gemini_html}
-    </div>
-"""
+        """)
+    chunks.append(param_grid_html)
+    chunks.append("\n        ")
+    chunks.append(gemini_html)
+    chunks.append("\n    </div>\n")
+    return chunks
+
+
+# Control-signal params left out of the parameter grid bars
+_PARAM_EXCLUDE: frozenset[str] = frozenset(
+    {"gate", "trigger", "velocity", "volts", "freq", "pitch"})
 
 
 def generate_param_grid_content(report: ModuleReport) -> str:
@@ -1326,12 +1797,12 @@ def generate_param_grid_content(report: ModuleReport) -> str:
     items_html = []
     for idx, perm in enumerate(report.param_permutations[:20], 1):  # Limit to 20
         # Generate parameter bars
-        param_bars = ""
-        for param_name in sorted(perm.params.keys()):
-            if param_name.lower() not in ["gate", "trigger", "velocity", "volts", "freq", "pitch"]:
-                value = perm.params[param_name]
-                min_val, max_val = param_ranges.get(param_name, (0, 1))
-                param_bars += generate_param_bar_html(param_name, value, min_val, max_val)
+        param_bars = "".join(
+            generate_param_bar_html(param_name, perm.params[param_name],
+                                    *param_ranges.get(param_name, (0, 1)))
+            for param_name in sorted(perm.params)
+            if param_name.lower() not in _PARAM_EXCLUDE
+        )
 
         items_html.append(f"""
         <div style="background:#1e1e35;padding:10px;border-radius:6px;margin-bottom:8px;">
@@ -1348,11 +1819,17 @@ def generate_param_grid_content(report: ModuleReport) -> str:
 # =============================================================================
 
 def process_module(module_name: str, output_dir: Path,
-                   config: ReportConfig) -> ModuleReport:
-    """Process a single module and generate its report."""
+                   config: ReportConfig,
+                   module_config: dict[str, Any] | None = None) -> ModuleReport:
+    """Process a single module and generate its report.
+
+    module_config may be passed in when the caller has already loaded it,
+    so pool workers do not each re-read test_config.json.
+    """
 
     # Load module config
-    module_config = load_module_config(module_name)
+    if module_config is None:
+        module_config = get_module_config(module_name)
     module_type = module_config.get("module_type", "instrument")
     description = module_config.get("description", "")
     skip_audio = module_config.get("skip_audio_tests", False)
@@ -1372,15 +1849,32 @@ def process_module(module_name: str, output_dir: Path,
             print(f"  Skipping {module_name}: {skip_reason}")
         return report
 
-    # Render showcase audio
+    # Render showcase audio, unless the WAV from a previous run was rendered
+    # from the same config and binary
     wav_path = output_dir / f"{module_name}_showcase.wav"
-    if config.verbose:
-        print(f"  Rendering showcase for {module_name}...")
+    hash_path = wav_path.with_suffix(".hash")
+    cache_key = showcase_cache_key(module_name) if config.use_render_cache else None
+    try:
+        cached = (cache_key is not None and wav_path.exists()
+                  and hash_path.read_text() == cache_key)
+    except OSError:
+        cached = False
 
-    if not render_showcase(module_name, wav_path, config.verbose):
-        report.status = "error"
-        report.issues.append("Failed to render showcase audio")
-        return report
+    if cached:
+        if config.verbose:
+            print(f"  Reusing cached showcase for {module_name}")
+    else:
+        if config.verbose:
+            print(f"  Rendering showcase for {module_name}...")
+        hash_path.unlink(missing_ok=True)
+
+        if not render_showcase(module_name, wav_path, config.verbose):
+            report.status = "error"
+            report.issues.append("Failed to render showcase audio")
+            return report
+
+        if cache_key is not None:
+            hash_path.write_text(cache_key)
 
     report.showcase_wav = wav_path
 
@@ -1402,42 +1896,51 @@ def process_module(module_name: str, output_dir: Path,
     if panel_svg:
         report.panel_svg = panel_svg
 
-    # Generate spectrogram
-    spectrogram_path = output_dir / f"{module_name}_spectrogram.png"
-    if generate_spectrogram(audio, spectrogram_path, module_name):
-        report.spectrogram = spectrogram_path
-
-    # Get module parameters for complete parameter graph
-    module_params = get_module_params(module_name)
+    # Gemini analysis is a network round trip that only needs the WAV, so it
+    # runs on a helper thread while the plots and quality analysis proceed
+    # here (CLAP runs batched across all modules in main())
+    with ThreadPoolExecutor(max_workers=1) as ai_pool:
+        ai_future = None
+        if not config.skip_gemini:
+            if config.verbose:
+                print(f"  Running AI analysis for {module_name}...")
+            showcase_context = format_showcase_context(showcase, module_type)
+            ai_future = ai_pool.submit(
+                run_ai_analysis, wav_path, module_name, showcase_context,
+                config.verbose, use_clap=False, use_gemini=True
+            )
 
-    # Generate parameter values graph (all params, with automations highlighted)
-    automation_path = output_dir / f"{module_name}_automation.png"
-    if generate_automation_graph(showcase, automation_path, module_params, "Parameter Values"):
-        report.automation_graph = automation_path
+        if not config.skip_plots:
+            # Generate spectrogram
+            spectrogram_path = output_dir / f"{module_name}_spectrogram.png"
+            if generate_spectrogram(audio, spectrogram_path, module_name,
+                                    fast=config.fast_images):
+                report.spectrogram = spectrogram_path
 
-    # Generate note score visualization
-    if showcase.notes:
-        note_path = output_dir / f"{module_name}_notes.png"
-        if generate_note_score(showcase, note_path, "Note Sequence"):
-            report.note_score = note_path
+            # Get module parameters for complete parameter graph
+            module_params = get_module_params(module_name)
 
-    # Analyze quality
-    if config.verbose:
-        print(f"  Analyzing quality for {module_name}...")
-    report.quality = analyze_quality(audio)
+            # Generate parameter values graph (all params, with automations highlighted)
+            automation_path = output_dir / f"{module_name}_automation.png"
+            if generate_automation_graph(showcase, automation_path, module_params, "Parameter Values"):
+                report.automation_graph = automation_path
 
-    # AI analysis (CLAP + optional Gemini)
-    use_clap = not config.skip_clap
-    use_gemini = not config.skip_gemini
+            # Generate note score visualization
+            if showcase.notes:
+                note_path = output_dir / f"{module_name}_notes.png"
+                if generate_note_score(showcase, note_path, "Note Sequence"):
+                    report.note_score = note_path
 
-    if use_clap or use_gemini:
+        # Analyze quality
         if config.verbose:
-            print(f"  Running AI analysis for {module_name}...")
-        showcase_context = format_showcase_context(showcase, module_type)
-        report.ai, report.gemini_analysis = run_ai_analysis(
-            wav_path, module_name, showcase_context, config.verbose,
-            use_clap=use_clap, use_gemini=use_gemini
-        )
+            print(f"  Analyzing quality for {module_name}...")
+        report.quality = analyze_quality(audio)
+        # Nothing below reads the samples; release them (or their mapping)
+        # before waiting on the AI call
+        del audio
+
+        if ai_future is not None:
+            report.ai, report.gemini_analysis = ai_future.result()
 
     # Determine status based on quality metrics
     issues = []
@@ -1467,6 +1970,112 @@ def process_module(module_name: str, output_dir: Path,
     return report
 
 
+def process_module_timed(module_name: str, output_dir: Path,
+                         config: ReportConfig,
+                         module_config: dict[str, Any] | None = None) -> ModuleReport:
+    """Run process_module and record its wall time on the report."""
+    start = time.perf_counter()
+    report = process_module(module_name, output_dir, config, module_config)
+    report.process_seconds = time.perf_counter() - start
+    return report
+
+
+def load_module_times() -> dict[str, float]:
+    """Load the per-module processing times saved by the last run."""
+    try:
+        with open(MODULE_TIMES_PATH) as f:
+            return {str(k): float(v) for k, v in json.load(f).items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def save_module_times(reports: list[ModuleReport]):
+    """Merge this run's per-module processing times into the times file."""
+    times = load_module_times()
+    times.update((r.module_name, round(r.process_seconds, 3))
+                 for r in reports if r.process_seconds > 0)
+    try:
+        with open(MODULE_TIMES_PATH, "w") as f:
+            json.dump(times, f, indent=2, sort_keys=True)
+    except OSError:
+        pass
+
+
+def write_json_report(reports: list[ModuleReport], json_path: Path):
+    """Write reports as an indented JSON array, one module dict at a time.
+
+    Produces the same layout as ``json.dump(list, indent=2)`` without holding
+    every module's dict in memory at once (serialized with orjson when it
+    is installed).
+    """
+    with open(json_path, "wb") as f:
+        f.write(b"[")
+        for i, report in enumerate(reports):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(_dumps_indented(report.to_dict()).replace(b"\n", b"\n  "))
+        f.write(b"\n]" if reports else b"]")
+
+
+_STATUS_SYMBOLS = {"pass": "✓", "needs_work": "⚠", "skip": "○", "error": "✗"}
+
+
+class ModuleProgress:
+    """Per-module completion log for the processing loop.
+
+    With tqdm installed (and not in verbose mode, whose per-module output
+    would tear the bar) this is a single progress line refreshed at most
+    twice a second, with errors still written out in full; otherwise one
+    line per module is printed.
+    """
+
+    def __init__(self, total: int, verbose: bool = False):
+        self.bar = None
+        if HAS_TQDM and not verbose:
+            self.bar = tqdm(total=total, mininterval=0.5, ncols=80, unit="module")
+
+    def done(self, module: str, status: str):
+        symbol = _STATUS_SYMBOLS.get(status, "?")
+        if self.bar is None:
+            print(f"  {symbol} {module} ({status})")
+            return
+        self.bar.update(1)
+        self.bar.set_postfix_str(f"{symbol} {module}", refresh=False)
+        if status == "error":
+            tqdm.write(f"  {symbol} {module} ({status})")
+
+    def failed(self, module: str, error: Exception):
+        if self.bar is None:
+            print(f"  ✗ {module} (error: {error})")
+        else:
+            self.bar.update(1)
+            tqdm.write(f"  ✗ {module} (error: {error})")
+
+    def close(self):
+        if self.bar is not None:
+            self.bar.close()
+
+
+def default_parallel_workers() -> int:
+    """Worker count for --parallel: the CPUs this process may run on, capped at 8."""
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = os.cpu_count() or 4
+    return max(1, min(8, available))
+
+
+def get_worker_context():
+    """Multiprocessing context for per-module workers.
+
+    forkserver starts workers from a clean single-threaded process, which is
+    safe with matplotlib/torch state in the parent; fall back to spawn where
+    it is unavailable.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
 def parse_args(args: list[str] | None = None) -> ReportConfig:
     """Parse command line arguments and return configuration."""
     parser = argparse.ArgumentParser(
@@ -1474,14 +2083,14 @@ def parse_args(args: list[str] | None = None) -> ReportConfig:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Modes:
-  --fast     No AI analysis (fastest, for CI)
+  --fast     No AI analysis or plots (fastest, for CI)
   (default)  CLAP analysis only (standard PR review)
   --full     CLAP + Gemini + parameter grid (deep dive)
         """
     )
     parser.add_argument("--module", "-m", help="Process specific module only")
     parser.add_argument("--fast", action="store_true",
-                        help="Fast mode: skip all AI analysis")
+                        help="Fast mode: skip all AI analysis and plots")
     parser.add_argument("--full", action="store_true",
                         help="Full mode: include Gemini and parameter grid")
     parser.add_argument("--gemini", action="store_true",
@@ -1492,21 +2101,42 @@ Modes:
                         help="Output HTML file path")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--json", action="store_true", help="Also output JSON report")
-    parser.add_argument("--parallel", "-p", type=int, default=4,
-                        help="Number of parallel workers (default: 4)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always re-render showcase audio, even if the module "
+                             "config and faust_render are unchanged")
+    parser.add_argument("--fast-images", action="store_true",
+                        help="Write spectrograms as plain colormapped images "
+                             "(no axes) instead of matplotlib plots")
+    parser.add_argument("--no-inline-assets", action="store_true",
+                        help="Copy audio and images to an assets/ directory next to "
+                             "the report instead of embedding them")
+    parser.add_argument("--external-assets", action="store_true",
+                        help="Write the stylesheet and script to report.css/report.js "
+                             "next to the report and link them")
+    parser.add_argument("--parallel", "-p", type=int, default=default_parallel_workers(),
+                        help="Number of parallel workers; 1 processes modules "
+                             "sequentially (default: available CPUs, at most 8)")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process",
+                        help="Run parallel workers as processes or threads (default: process)")
 
     parsed = parser.parse_args(args)
 
     config = ReportConfig()
     config.verbose = parsed.verbose
     config.parallel_workers = parsed.parallel
+    config.executor = parsed.executor
+    config.use_render_cache = not parsed.no_cache
     config.output_path = Path(parsed.output)
+    config.inline_assets = not parsed.no_inline_assets
+    config.external_assets = parsed.external_assets
+    config.fast_images = parsed.fast_images
 
     # Mode configuration
     if parsed.fast:
         config.skip_clap = True
         config.skip_gemini = True
         config.include_param_grid = False
+        config.skip_plots = True
     elif parsed.full:
         config.skip_clap = False
         config.skip_gemini = False
@@ -1520,13 +2150,40 @@ Modes:
     # Store parsed args for module filtering
     config._module = parsed.module
     config._json = parsed.json
+    config._full = parsed.full
 
     return config
 
 
+def check_ai_dependencies(config: ReportConfig) -> list[str]:
+    """Check the AI backends a run needs against the installed packages.
+
+    CLAP in the default mode is best-effort, so it is switched off (without
+    importing ai_audio_analysis just to find out it is unavailable). Returns
+    the backends --full requires but cannot run.
+    """
+    missing = []
+    if not config.skip_clap and not HAS_CLAP_DEPS:
+        if config._full:
+            missing.append("CLAP (torch, transformers, librosa)")
+        else:
+            print("CLAP dependencies not installed; skipping CLAP analysis",
+                  file=sys.stderr)
+            config.skip_clap = True
+    if config._full and not config.skip_gemini and not HAS_GEMINI_DEPS:
+        missing.append("Gemini (google-generativeai)")
+    return missing
+
+
 def main():
     config = parse_args()
 
+    # Fail before any rendering when --full cannot run a backend it requires
+    missing = check_ai_dependencies(config)
+    if missing:
+        print(f"Missing dependencies for {', '.join(missing)}", file=sys.stderr)
+        sys.exit(2)
+
     # Ensure output directory exists
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -1534,7 +2191,7 @@ def main():
     if config._module:
         modules = [config._module]
     else:
-        modules = get_available_modules()
+        modules = list(get_available_modules())
         if not modules:
             print("No modules found. Ensure faust_render is built.")
             sys.exit(1)
@@ -1551,45 +2208,86 @@ def main():
 
     # Process modules
     reports = []
+    progress = ModuleProgress(len(modules), config.verbose)
+    # Without the CLAP pass reports are final once processed, so their cards
+    # are rendered while later modules are still running
+    spool = CardSpool(config.output_path, config) if config.skip_clap else None
 
     if config.parallel_workers > 1 and len(modules) > 1:
-        # Parallel processing
-        with ThreadPoolExecutor(max_workers=config.parallel_workers) as executor:
-            futures = {
-                executor.submit(process_module, m, OUTPUT_DIR, config): m
-                for m in modules
-            }
-            for future in as_completed(futures):
-                module = futures[future]
-                try:
-                    report = future.result()
-                    reports.append(report)
-                    status_symbol = {"pass": "✓", "needs_work": "⚠", "skip": "○", "error": "✗"}.get(report.status, "?")
-                    print(f"  {status_symbol} {module} ({report.status})")
-                except Exception as e:
-                    print(f"  ✗ {module} (error: {e})")
+        # Longest-first scheduling: submit the modules that took longest last
+        # time first (unknown modules count as longest) to shorten the tail
+        module_times = load_module_times()
+        modules.sort(key=lambda m: module_times.get(m, math.inf), reverse=True)
+
+        # Parallel processing: analysis and plotting are CPU-bound, so each
+        # module runs in its own process rather than contending for the GIL.
+        # Threads remain available for runs dominated by network-bound AI calls.
+        if config.executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=config.parallel_workers)
+        else:
+            pool = ProcessPoolExecutor(max_workers=config.parallel_workers,
+                                       mp_context=get_worker_context())
+        with pool as executor:
+            # Keep at most two modules per worker in flight, so pending
+            # results (and their memory) stay bounded on large module sets
+            pending_modules = iter(modules)
+            futures = {}
+
+            def submit_next():
+                module = next(pending_modules, None)
+                if module is not None:
+                    future = executor.submit(process_module_timed, module, OUTPUT_DIR,
+                                             config, get_module_config(module))
+                    futures[future] = module
+
+            for _ in range(2 * config.parallel_workers):
+                submit_next()
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    module = futures.pop(future)
+                    try:
+                        report = future.result()
+                        reports.append(report)
+                        progress.done(module, report.status)
+                        if spool is not None:
+                            spool.add(report)
+                    except Exception as e:
+                        progress.failed(module, e)
+                    submit_next()
     else:
         # Sequential processing
         for module in modules:
             try:
-                report = process_module(module, OUTPUT_DIR, config)
+                report = process_module_timed(module, OUTPUT_DIR, config)
                 reports.append(report)
-                status_symbol = {"pass": "✓", "needs_work": "⚠", "skip": "○", "error": "✗"}.get(report.status, "?")
-                print(f"  {status_symbol} {module} ({report.status})")
+                progress.done(module, report.status)
+                if spool is not None:
+                    spool.add(report)
             except Exception as e:
-                print(f"  ✗ {module} (error: {e})")
+                progress.failed(module, e)
+
+    progress.close()
+    save_module_times(reports)
+
+    # CLAP analysis for all modules at once
+    if not config.skip_clap:
+        print("Running CLAP analysis...")
+        run_clap_batch(reports, config.verbose)
 
     # Sort reports by module name
     reports.sort(key=lambda r: r.module_name)
 
     # Generate HTML report
-    generate_html_report(reports, config.output_path, config)
+    generate_html_report(reports, config.output_path, config, spool)
+    if spool is not None:
+        spool.close()
 
     # Optionally output JSON
     if config._json:
         json_path = config.output_path.with_suffix(".json")
-        with open(json_path, "w") as f:
-            json.dump([r.to_dict() for r in reports], f, indent=2)
+        write_json_report(reports, json_path)
         print(f"JSON report written to: {json_path}")
 
     # Summary
@@ -18,14 +18,18 @@ Usage:
 import argparse
 import itertools
 import json
+import math
 import os
 import shutil
 import sys
+from collections.abc import Iterator
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 # Import shared utilities
 from utils import (
     get_project_root,
@@ -33,6 +37,7 @@ from utils import (
     run_faust_render,
     get_modules,
     get_module_params,
+    iter_render_audio_batch,
     load_audio,
     load_module_config,
     extract_audio_stats,
@@ -43,8 +48,10 @@ from utils import (
 DURATION = 2.0
 PARAM_VALUES_FULL = 5  # Number of values per parameter (full grid)
 PARAM_VALUES_QUICK = 3  # Number of values per parameter (quick mode)
-MAX_COMBINATIONS = 500  # Maximum combinations per module
+MAX_COMBINATIONS = 500  # Maximum combinations per module (larger grids are sampled)
+SOBOL_SEED = 0  # Fixed, so reruns sample the same parameter points
 NUM_WORKERS = 8  # Number of parallel workers
+BATCHES_PER_WORKER = 4  # Render batches per worker (more batches = finer progress)
 
 # Try to import audio quality analysis
 try:
@@ -92,7 +99,11 @@ def generate_param_values(
 def generate_param_grid(
     params: list[dict[str, Any]], num_values: int, max_combinations: int
 ) -> list[dict[str, float]]:
-    """Generate parameter combinations for testing."""
+    """Generate parameter combinations for testing.
+
+    A grid larger than max_combinations is replaced by a Sobol sample of the
+    same size (see sample_param_space); without scipy it is truncated.
+    """
     # Get values for each parameter
     param_values = {}
     for param in params:
@@ -103,6 +114,11 @@ def generate_param_grid(
     names = list(param_values.keys())
     value_lists = [param_values[name] for name in names]
 
+    if math.prod(len(values) for values in value_lists) > max_combinations:
+        sampled = sample_param_space(params, param_values, max(max_combinations, 1))
+        if sampled is not None:
+            return sampled
+
     combinations = []
     for combo in itertools.product(*value_lists):
         param_dict = {name: value for name, value in combo}
@@ -113,20 +129,51 @@ def generate_param_grid(
     return combinations
 
 
-def render_audio_with_filename(
-    module_name: str,
-    params: dict[str, float],
-    output_dir: Path,
-    duration: float = DURATION,
-    sample_rate: int = SAMPLE_RATE,
-) -> tuple[bool, Path, dict[str, float] | None]:
-    """Render audio for a parameter combination with auto-generated filename.
+def sample_param_space(
+    params: list[dict[str, Any]],
+    param_values: dict[str, list[tuple[str, float]]],
+    num_samples: int,
+) -> list[dict[str, float]] | None:
+    """Sample parameter combinations with a scrambled Sobol sequence.
+
+    Truncating an oversized product only ever varies the last few
+    parameters; a quasi-random sample of the swept parameters' ranges
+    covers every dimension with the same number of renders. Parameters
+    generate_param_values holds fixed keep their single value. Returns
+    None if scipy is not available.
+    """
+    try:
+        from scipy.stats import qmc
+    except ImportError:
+        return None
+
+    swept = [p for p in params
+             if len(param_values[p["name"]]) > 1 and p["max"] > p["min"]]
+    if not swept:
+        return None
+    fixed = {name: values[0][1] for name, values in param_values.items()}
 
-    Returns: (success, output_path, metadata_if_hashed)
-    The third element is the params dict if hash was used, None otherwise.
+    # Sobol points are balanced in powers of two: draw the next one up
+    sampler = qmc.Sobol(d=len(swept), scramble=True, seed=SOBOL_SEED)
+    unit = sampler.random_base2(math.ceil(math.log2(num_samples)))[:num_samples]
+    points = qmc.scale(unit, [p["min"] for p in swept], [p["max"] for p in swept])
+
+    swept_names = [p["name"] for p in swept]
+    return [
+        {**fixed, **dict(zip(swept_names, row))}
+        for row in points.tolist()
+    ]
+
+
+def wav_filename(
+    module_name: str, params: dict[str, float]
+) -> tuple[str, dict[str, float] | None]:
+    """Build the WAV filename for a parameter combination.
+
+    Returns: (filename, metadata_if_hashed)
+    The second element is the params dict if hash was used, None otherwise.
     """
     import hashlib
-    from utils import render_audio as _render_audio
 
     # Create filename from parameters
     param_str = "_".join(f"{k}={v:.2f}" for k, v in sorted(params.items()))
@@ -137,61 +184,86 @@ def render_audio_with_filename(
         param_str = f"hash_{param_hash}"
         hash_metadata = params  # Return params for metadata file
 
-    filename = f"{module_name}_{param_str}.wav"
-    output_path = output_dir / filename
+    return f"{module_name}_{param_str}.wav", hash_metadata
 
-    success, _ = _render_audio(
-        module_name, params, output_path, duration, sample_rate
-    )
-    return success, output_path, hash_metadata
 
+# Spectrogram stack of this worker process: (generate_spectrogram, figure),
+# set up once by _worker_init
+_spectrogram = None
+
+
+def _worker_init():
+    """Import librosa/matplotlib once per worker and create its spectrogram figure."""
+    global _spectrogram
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from analyze_audio import generate_spectrogram as gen_spec
+
+    _spectrogram = (gen_spec, plt.figure())
 
-def generate_spectrogram(wav_path: Path, output_dir: Path) -> tuple[bool, Path]:
-    """Generate spectrogram for a WAV file."""
+
+def generate_spectrogram(
+    audio: np.ndarray, wav_path: Path, output_dir: Path
+) -> tuple[bool, Path]:
+    """Generate spectrogram for a rendered WAV from its (samples, channels) audio."""
     output_path = output_dir / wav_path.with_suffix(".png").name
 
     try:
-        # Import here to avoid startup cost if not needed
-        from analyze_audio import generate_spectrogram as gen_spec, load_audio
-
-        y, sr = load_audio(str(wav_path))
-        fig = gen_spec(y, sr, title=wav_path.stem, output_path=str(output_path))
-        import matplotlib.pyplot as plt
+        if _spectrogram is None:
+            _worker_init()
+        gen_spec, fig = _spectrogram
 
-        plt.close(fig)
+        # analyze_audio takes (channels, samples)
+        gen_spec(audio.T, SAMPLE_RATE, title=wav_path.stem,
+                 output_path=str(output_path), fig=fig)
         return True, output_path
     except Exception as e:
         print(f"  Error generating spectrogram: {e}")
         return False, output_path
 
 
-def render_single_test(args: tuple) -> dict[str, Any]:
-    """Worker function for parallel rendering. Renders audio and generates spectrogram."""
-    module_name, param_combo, wav_dir, spec_dir, duration, sample_rate, include_quality = args
+def render_batch_worker(args: tuple) -> list[dict[str, Any]]:
+    """Worker function for parallel rendering.
 
-    # Render audio
-    success, wav_path, hash_metadata = render_audio_with_filename(
-        module_name, param_combo, wav_dir, duration, sample_rate
-    )
-    if not success:
-        return {"params": param_combo, "success": False}
+    Renders a chunk of parameter combinations in a single faust_render
+    process and generates a spectrogram (and quality metrics) for each WAV
+    as soon as it is written, while faust_render carries on with the next.
+    """
+    module_name, param_combos, wav_dir, spec_dir, duration, sample_rate, include_quality = args
+
+    names = [wav_filename(module_name, combo) for combo in param_combos]
+    jobs = [(combo, wav_dir / filename) for combo, (filename, _) in zip(param_combos, names)]
+
+    results = [None] * len(jobs)
+    for i, success in iter_render_audio_batch(module_name, jobs, duration, sample_rate):
+        combo, wav_path = jobs[i]
+        if success:
+            results[i] = finish_render(
+                module_name, combo, wav_path, names[i][1], spec_dir, include_quality,
+            )
+        else:
+            results[i] = {"params": combo, "success": False}
+    return results
 
-    # If we used a hash filename, save metadata for the report generator
-    if hash_metadata is not None:
-        metadata_file = wav_dir / "param_metadata.json"
-        # Load existing metadata or create new
-        existing = {}
-        if metadata_file.exists():
-            try:
-                existing = json.loads(metadata_file.read_text())
-            except Exception:
-                pass
-        # Add this file's metadata
-        existing[wav_path.name] = hash_metadata
-        metadata_file.write_text(json.dumps(existing, indent=2))
 
-    # Generate spectrogram
-    spec_success, spec_path = generate_spectrogram(wav_path, spec_dir)
+def finish_render(
+    module_name: str,
+    param_combo: dict[str, float],
+    wav_path: Path,
+    hash_metadata: dict[str, float] | None,
+    spec_dir: Path,
+    include_quality: bool,
+) -> dict[str, Any]:
+    """Post-process one rendered WAV: spectrogram and quality metrics."""
+    # Read the WAV once (memory-mapped) for both the spectrogram and the
+    # quality metrics
+    audio = load_audio(wav_path, mono=False)
+    if audio is None:
+        spec_success, spec_path = False, None
+    else:
+        spec_success, spec_path = generate_spectrogram(audio, wav_path, spec_dir)
 
     result = {
         "params": param_combo,
@@ -200,10 +272,16 @@ def render_single_test(args: tuple) -> dict[str, Any]:
         "spectrogram": str(spec_path) if spec_success else None,
     }
 
+    # Hashed filenames need their params recorded for the report generator;
+    # run_module_tests collects these into param_metadata.json
+    if hash_metadata is not None:
+        result["hash_metadata"] = hash_metadata
+
     # Run audio quality analysis if requested
     if include_quality and HAS_AUDIO_QUALITY:
-        audio = load_audio(wav_path)
         if audio is not None:
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1, dtype=np.float32)
             try:
                 quality_report = analyze_audio_quality(audio, SAMPLE_RATE, module_name)
                 result["quality"] = {
@@ -313,17 +391,35 @@ def generate_html_report(
 ) -> Path:
     """Generate HTML report with all spectrograms, quality metrics, and AI analysis."""
     report_path = output_dir / "report.html"
+
+    # Create audio directory and copy WAV files
+    audio_dir = output_dir / "audio"
+    audio_dir.mkdir(parents=True, exist_ok=True)
+
+    # Stream the report chunk by chunk rather than building it in memory
+    with open(report_path, "w", buffering=1 << 20) as f:
+        f.writelines(iter_html_report(
+            audio_dir, module_results, param_metadata, ai_results, include_quality
+        ))
+
+    return report_path
+
+
+def iter_html_report(
+    audio_dir: Path,
+    module_results: dict[str, list[dict[str, Any]]],
+    param_metadata: dict[str, list[dict[str, Any]]] = None,
+    ai_results: dict[str, dict[str, Any]] = None,
+    include_quality: bool = False,
+) -> Iterator[str]:
+    """Yield the HTML report in chunks, copying each WAV into audio_dir."""
     param_metadata = param_metadata or {}
     ai_results = ai_results or {}
 
     total_renders = sum(len(results) for results in module_results.values())
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # Create audio directory and copy WAV files
-    audio_dir = output_dir / "audio"
-    audio_dir.mkdir(parents=True, exist_ok=True)
-
-    html = f"""<!DOCTYPE html>
+    yield f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Faust Module Audio Test Report</title>
@@ -759,8 +855,8 @@ def generate_html_report(
         ai_data = ai_results.get(module_name)
         quality_summary = compute_module_quality_summary(results) if include_quality else None
 
-        html += f'<div class="module" id="{module_name}">\n'
-        html += f"<h2>{module_name}</h2>\n"
+        yield f'<div class="module" id="{module_name}">\n'
+        yield f"<h2>{module_name}</h2>\n"
 
         # AI Analysis Card (collapsible, open by default)
         if ai_data:
@@ -776,108 +872,108 @@ def generate_html_report(
                     return "medium"
                 return "poor"
 
-            html += '''
+            yield '''
             <div class="ai-card">
                 <h4 class="collapsible" onclick="toggleCollapsible(this)">
                     <span>&#129302;</span> AI Analysis (Gemini)
                 </h4>
                 <div class="collapsible-content">
 '''
-            html += '<div class="ai-scores">\n'
+            yield '<div class="ai-scores">\n'
             if quality_score is not None:
-                html += f'''
+                yield f'''
                 <div class="ai-score">
                     <div class="ai-score-label">Quality</div>
                     <div class="ai-score-value {get_score_class(quality_score)}">{quality_score}/10</div>
                 </div>
 '''
             if musical_score is not None:
-                html += f'''
+                yield f'''
                 <div class="ai-score">
                     <div class="ai-score-label">Musical</div>
                     <div class="ai-score-value {get_score_class(musical_score)}">{musical_score}/10</div>
                 </div>
 '''
-            html += '</div>\n'
+            yield '</div>\n'
 
             issues = ai_data.get("issues", [])
             if issues:
-                html += '<div class="ai-issues">\n<h5>Issues</h5>\n<ul>\n'
+                yield '<div class="ai-issues">\n<h5>Issues</h5>\n<ul>\n'
                 for issue in issues[:5]:
-                    html += f'<li>{issue}</li>\n'
-                html += '</ul>\n</div>\n'
+                    yield f'<li>{issue}</li>\n'
+                yield '</ul>\n</div>\n'
 
             suggestions = ai_data.get("suggestions", [])
             if suggestions:
-                html += '<div class="ai-suggestions">\n<h5>Suggestions</h5>\n<ul>\n'
+                yield '<div class="ai-suggestions">\n<h5>Suggestions</h5>\n<ul>\n'
                 for suggestion in suggestions[:5]:
-                    html += f'<li>{suggestion}</li>\n'
-                html += '</ul>\n</div>\n'
+                    yield f'<li>{suggestion}</li>\n'
+                yield '</ul>\n</div>\n'
 
-            html += '''
+            yield '''
                 </div>
             </div>
 '''
 
         # Quality Summary Card
         if quality_summary and any(quality_summary.values()):
-            html += '''
+            yield '''
             <div class="quality-card">
                 <h4>Quality Summary</h4>
                 <div class="quality-metrics">
 '''
             if "avg_thd" in quality_summary:
-                html += f'''
+                yield f'''
                 <div class="quality-metric">
                     <span class="quality-metric-label">Avg THD:</span>
                     <span class="quality-metric-value">{quality_summary["avg_thd"]:.1f}%</span>
                 </div>
 '''
             if "max_peak" in quality_summary:
-                html += f'''
+                yield f'''
                 <div class="quality-metric">
                     <span class="quality-metric-label">Max Peak:</span>
                     <span class="quality-metric-value">{quality_summary["max_peak"]:.2f}</span>
                 </div>
 '''
             if "min_hnr" in quality_summary and "max_hnr" in quality_summary:
-                html += f'''
+                yield f'''
                 <div class="quality-metric">
                     <span class="quality-metric-label">HNR:</span>
                     <span class="quality-metric-value">{quality_summary["min_hnr"]:.0f}-{quality_summary["max_hnr"]:.0f} dB</span>
                 </div>
 '''
             if "avg_score" in quality_summary:
-                html += f'''
+                yield f'''
                 <div class="quality-metric">
                     <span class="quality-metric-label">Avg Score:</span>
                     <span class="quality-metric-value">{quality_summary["avg_score"]:.0f}/100</span>
                 </div>
 '''
-            html += '</div>\n'
+            yield '</div>\n'
 
             if "characters" in quality_summary:
-                html += '<div class="character-distribution">\n'
+                yield '<div class="character-distribution">\n'
                 for char, pct in sorted(quality_summary["characters"].items(), key=lambda x: -x[1]):
-                    html += f'<span class="character-tag">{char} ({pct}%)</span>\n'
-                html += '</div>\n'
+                    yield f'<span class="character-tag">{char} ({pct}%)</span>\n'
+                yield '</div>\n'
 
-            html += '</div>\n'
+            yield '</div>\n'
 
         # Parameter legend
         if module_params:
-            html += '<div class="module-info">\n'
-            html += '<h3>Parameter Ranges</h3>\n'
-            html += '<div class="param-legend">\n'
+            yield '<div class="module-info">\n'
+            yield '<h3>Parameter Ranges</h3>\n'
+            yield '<div class="param-legend">\n'
             for p in module_params:
                 # Skip gate/trigger/velocity params
                 if p["name"].lower() in ["gate", "trigger", "velocity", "volts", "freq", "pitch"]:
                     continue
-                html += f'<div class="param-legend-item"><strong>{p["name"]}</strong>: {p["min"]:.2f} → {p["max"]:.2f}</div>\n'
-            html += '</div>\n</div>\n'
+                yield f'<div class="param-legend-item"><strong>{p["name"]}</strong>: {p["min"]:.2f} → {p["max"]:.2f}</div>\n'
+            yield '</div>\n</div>\n'
 
         # Renders section - collapsible, closed by default
-        html += f'''
+        yield f'''
         <div class="renders-toggle" onclick="toggleRenders(this)">
             Parameter Renders ({len(results)} combinations)
         </div>
@@ -952,7 +1048,7 @@ def generate_html_report(
                         cls = "good" if score >= 80 else ("medium" if score >= 60 else "poor")
                         quality_badges += f'<span class="quality-badge {cls}">{score:.0f}/100</span>'
 
-                html += f'''
+                yield f'''
                 <div class="item">
                     <div class="item-number">#{idx}</div>
                     <a href="spectrograms/{rel_spec}" target="_blank">
@@ -966,17 +1062,17 @@ def generate_html_report(
                 </div>
 '''
             elif not success:
-                html += f'''
+                yield f'''
                 <div class="item error">
                     <div class="item-number">#{idx}</div>
                     <p>Render failed</p>
                 </div>
 '''
 
-        html += "</div>\n</div>\n</div>\n"
+        yield "</div>\n</div>\n</div>\n"
 
     # Add JavaScript for lazy loading audio and collapsible sections
-    html += """
+    yield """
     <script>
     function loadAudio(button) {
         const container = button.parentElement;
@@ -1055,12 +1151,7 @@ def generate_html_report(
     </script>
 """
 
-    html += "</body></html>"
-
-    with open(report_path, "w") as f:
-        f.write(html)
-
-    return report_path
+    yield "</body></html>"
 
 
 def run_module_tests(
@@ -1089,6 +1180,9 @@ def run_module_tests(
     # Generate parameter grid
     grid = generate_param_grid(params, num_values, max_combinations)
     print(f"  Testing {len(grid)} parameter combinations ({num_workers} workers)")
+    grid_size = math.prod(len(generate_param_values(p, num_values)) for p in params)
+    if grid_size > len(grid):
+        print(f"  Grid of {grid_size} combinations sampled down to {len(grid)}")
     if include_quality:
         print(f"  Quality analysis: enabled")
 
@@ -1098,39 +1192,57 @@ def run_module_tests(
     wav_dir.mkdir(parents=True, exist_ok=True)
     spec_dir.mkdir(parents=True, exist_ok=True)
 
-    # Prepare work items
+    # Prepare work items: batches of renders, so each faust_render process
+    # (and its DSP set-up) is shared by many renders. A few batches per
+    # worker rather than one keep the progress output moving during the run.
+    # Interleaved slices keep neighbouring, similarly expensive combinations
+    # spread across batches.
+    num_batches = max(1, min(BATCHES_PER_WORKER * num_workers, len(grid)))
     work_items = [
-        (module_name, param_combo, wav_dir, spec_dir, DURATION, SAMPLE_RATE, include_quality)
-        for param_combo in grid
+        (module_name, grid[i::num_batches], wav_dir, spec_dir, DURATION, SAMPLE_RATE, include_quality)
+        for i in range(num_batches)
     ]
 
     # Run in parallel
     results = []
+    hash_metadata = {}
     completed = 0
     failed = 0
 
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        futures = {executor.submit(render_single_test, item): i for i, item in enumerate(work_items)}
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_worker_init) as executor:
+        futures = {executor.submit(render_batch_worker, item): i for i, item in enumerate(work_items)}
 
         for future in as_completed(futures):
-            completed += 1
+            batch = work_items[futures[future]][1]
+            previous = completed
+            completed += len(batch)
             try:
-                result = future.result()
-                results.append(result)
-                if result["success"]:
-                    status = "OK"
-                else:
-                    status = "FAILED"
-                    failed += 1
-            except Exception as e:
-                results.append({"params": work_items[futures[future]][1], "success": False})
-                status = f"ERROR: {e}"
-                failed += 1
+                batch_results = future.result()
+            except Exception:
+                batch_results = [{"params": combo, "success": False} for combo in batch]
+            results.extend(batch_results)
+            failed += sum(1 for r in batch_results if not r["success"])
+            for r in batch_results:
+                if "hash_metadata" in r:
+                    hash_metadata[Path(r["wav"]).name] = r.pop("hash_metadata")
 
             # Progress update every 10 items or at the end
-            if completed % 10 == 0 or completed == len(grid):
+            if completed // 10 > previous // 10 or completed == len(grid):
                 print(f"  Progress: {completed}/{len(grid)} ({failed} failed)", flush=True)
 
+    # Save the params behind hashed filenames for the report generator,
+    # merged with those of earlier runs into the same directory
+    if hash_metadata:
+        metadata_file = wav_dir / "param_metadata.json"
+        existing = {}
+        if metadata_file.exists():
+            try:
+                existing = json.loads(metadata_file.read_text())
+            except Exception:
+                pass
+        existing.update(hash_metadata)
+        metadata_file.write_text(json.dumps(existing, indent=2))
+
     print(f"  Completed: {len(results)} renders ({failed} failed)")
     return results, params
 
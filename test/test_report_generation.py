@@ -234,6 +234,44 @@ class TestQualityAnalysis:
         metrics = analyze_quality(audio)
         assert metrics.peak_amplitude == 0.0
 
+    @staticmethod
+    def _sine_with_harmonic(bin_offset: float, harmonic_level: float) -> np.ndarray:
+        """1 s sine at bin_offset Welch bins plus a 2nd harmonic at harmonic_level."""
+        from generate_unified_report import SAMPLE_RATE, WELCH_NPERSEG
+        freq = bin_offset * SAMPLE_RATE / WELCH_NPERSEG
+        t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+        return 0.5 * (np.sin(2 * np.pi * freq * t)
+                      + harmonic_level * np.sin(2 * np.pi * 2 * freq * t))
+
+    def test_thd_known_harmonic(self):
+        """A 10% 2nd harmonic on a bin-centred sine should read 10% THD."""
+        pytest.importorskip("scipy")
+        from generate_unified_report import analyze_quality
+        metrics = analyze_quality(self._sine_with_harmonic(25.0, 0.1))
+        assert abs(metrics.thd_percent - 10.0) < 0.5
+
+    def test_thd_harmonic_with_leakage(self):
+        """A harmonic falling between bins should still be picked up."""
+        pytest.importorskip("scipy")
+        from generate_unified_report import analyze_quality
+        # Fundamental at bin 25.5 peaks at bin 25; the harmonic lands at 51
+        metrics = analyze_quality(self._sine_with_harmonic(25.5, 0.1))
+        assert 8.0 < metrics.thd_percent < 12.5
+
+    def test_thd_pure_sine(self):
+        """A pure sine should read near-zero THD."""
+        pytest.importorskip("scipy")
+        from generate_unified_report import analyze_quality
+        metrics = analyze_quality(self._sine_with_harmonic(25.0, 0.0))
+        assert metrics.thd_percent < 0.1
+
+    def test_thd_excludes_fundamental_bin(self):
+        """A fundamental in bin 1 must not be counted as its own 2nd harmonic."""
+        pytest.importorskip("scipy")
+        from generate_unified_report import analyze_quality
+        metrics = analyze_quality(self._sine_with_harmonic(1.0, 0.0))
+        assert metrics.thd_percent < 100.0
+
 
 # =============================================================================
 # Test data classes
@@ -270,6 +308,18 @@ class TestModuleReport:
         d = report.to_dict()
         assert d["issues"] == ["Issue 1", "Issue 2"]
 
+    def test_html_fields_follow_mutation(self):
+        """Escaped fields should reflect issues and analysis added later."""
+        from generate_unified_report import ModuleReport
+        report = ModuleReport(module_name="TestModule", module_type="instrument",
+                              description="Test")
+        assert report.issues_html == ()
+        assert report.gemini_analysis_html == ""
+        report.issues.append("Peak < 0.1")
+        report.gemini_analysis = "Sounds <harsh>"
+        assert report.issues_html == ("Peak &lt; 0.1",)
+        assert report.gemini_analysis_html == "Sounds &lt;harsh&gt;"
+
 
 class TestQualityMetrics:
     """Tests for QualityMetrics data class."""
@@ -375,6 +425,226 @@ class TestCLIArgs:
         assert config.parallel_workers == 8
 
 
+class TestAIDependencyCheck:
+    """Tests for the AI backend dependency check done in main()."""
+
+    @pytest.fixture
+    def deps(self, monkeypatch):
+        """Set which AI backends count as installed."""
+        import generate_unified_report
+
+        def set_deps(clap, gemini):
+            monkeypatch.setattr(generate_unified_report, "HAS_CLAP_DEPS", clap)
+            monkeypatch.setattr(generate_unified_report, "HAS_GEMINI_DEPS", gemini)
+        return set_deps
+
+    def test_all_installed(self, deps):
+        """Nothing is missing or switched off when every backend is installed."""
+        from generate_unified_report import check_ai_dependencies, parse_args
+        deps(clap=True, gemini=True)
+        config = parse_args(["--full"])
+        assert check_ai_dependencies(config) == []
+        assert config.skip_clap is False
+        assert config.skip_gemini is False
+
+    def test_default_mode_skips_missing_clap(self, deps, capsys):
+        """Default mode should skip CLAP rather than fail."""
+        from generate_unified_report import check_ai_dependencies, parse_args
+        deps(clap=False, gemini=False)
+        config = parse_args([])
+        assert check_ai_dependencies(config) == []
+        assert config.skip_clap is True
+        assert "skipping CLAP" in capsys.readouterr().err
+
+    def test_full_mode_reports_missing(self, deps):
+        """--full should report every backend it cannot run."""
+        from generate_unified_report import check_ai_dependencies, parse_args
+        deps(clap=False, gemini=False)
+        missing = check_ai_dependencies(parse_args(["--full"]))
+        assert len(missing) == 2
+        assert any("CLAP" in m for m in missing)
+        assert any("Gemini" in m for m in missing)
+
+    def test_gemini_flag_falls_back(self, deps):
+        """--gemini alone should leave a missing Gemini SDK to the analysis fallback."""
+        from generate_unified_report import check_ai_dependencies, parse_args
+        deps(clap=True, gemini=False)
+        config = parse_args(["--gemini"])
+        assert check_ai_dependencies(config) == []
+        assert config.skip_gemini is False
+
+    def test_main_exits_when_full_deps_missing(self, deps, monkeypatch):
+        """main() should exit before processing modules when --full cannot run."""
+        import generate_unified_report
+        deps(clap=False, gemini=True)
+        monkeypatch.setattr(sys, "argv", ["generate_unified_report.py", "--full"])
+        monkeypatch.setattr(generate_unified_report, "get_available_modules",
+                            lambda: pytest.fail("modules processed"))
+        with pytest.raises(SystemExit) as exc:
+            generate_unified_report.main()
+        assert exc.value.code == 2
+
+
+# =============================================================================
+# Test showcase render cache
+# =============================================================================
+
+class TestShowcaseRenderCache:
+    """Tests for reusing showcase WAVs across runs (showcase_cache_key)."""
+
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        """Fake renderer binary, module config and render call."""
+        import generate_unified_report
+        from scipy.io import wavfile
+
+        exe = tmp_path / "faust_render"
+        exe.write_bytes(b"renderer v1")
+        config_path = tmp_path / "src" / "modules" / "TestMod" / "test_config.json"
+        config_path.parent.mkdir(parents=True)
+        config_path.write_text('{"module_type": "filter"}')
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        renders = []
+
+        def fake_render(module_name, output_path, verbose=False):
+            renders.append(module_name)
+            t = np.arange(4800) / 48000
+            wavfile.write(output_path, 48000, (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32))
+            return True
+
+        monkeypatch.setattr(generate_unified_report, "get_render_executable", lambda: exe)
+        monkeypatch.setattr(generate_unified_report, "get_project_root", lambda: tmp_path)
+        monkeypatch.setattr(generate_unified_report, "render_showcase", fake_render)
+        return exe, config_path, output_dir, renders
+
+    def _process(self, output_dir, *args):
+        from generate_unified_report import parse_args, process_module
+        config = parse_args(["--fast", *args])
+        return process_module("TestMod", output_dir, config, {"module_type": "filter"})
+
+    def test_key_is_stable(self, env):
+        """Identical config and renderer should give the same key."""
+        from generate_unified_report import showcase_cache_key
+        assert showcase_cache_key("TestMod") == showcase_cache_key("TestMod")
+
+    def test_key_changes_with_config(self, env):
+        """Editing test_config.json should change the key."""
+        from generate_unified_report import showcase_cache_key
+        _, config_path, _, _ = env
+        before = showcase_cache_key("TestMod")
+        config_path.write_text('{"module_type": "effect"}')
+        assert showcase_cache_key("TestMod") != before
+
+    def test_key_changes_with_renderer(self, env):
+        """Rebuilding faust_render (new mtime or size) should change the key."""
+        import os
+        from generate_unified_report import showcase_cache_key
+        exe, _, _, _ = env
+        before = showcase_cache_key("TestMod")
+        st = exe.stat()
+        os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        after_mtime = showcase_cache_key("TestMod")
+        assert after_mtime != before
+        os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        exe.write_bytes(b"renderer v2, longer")
+        os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert showcase_cache_key("TestMod") != after_mtime
+
+    def test_key_none_without_renderer(self, env):
+        """No key (so no reuse) when faust_render is missing."""
+        from generate_unified_report import showcase_cache_key
+        exe, _, _, _ = env
+        exe.unlink()
+        assert showcase_cache_key("TestMod") is None
+
+    def test_reuses_wav_when_unchanged(self, env):
+        """A second run with the same inputs should not re-render."""
+        _, _, output_dir, renders = env
+        self._process(output_dir)
+        report = self._process(output_dir)
+        assert renders == ["TestMod"]
+        assert report.showcase_wav == output_dir / "TestMod_showcase.wav"
+        assert report.status != "error"
+
+    def test_rerenders_when_config_changes(self, env):
+        """Changing the module config should re-render the showcase."""
+        _, config_path, output_dir, renders = env
+        self._process(output_dir)
+        config_path.write_text('{"module_type": "effect"}')
+        self._process(output_dir)
+        assert renders == ["TestMod", "TestMod"]
+
+    def test_rerenders_when_renderer_changes(self, env):
+        """A rebuilt faust_render should re-render the showcase."""
+        import os
+        exe, _, output_dir, renders = env
+        self._process(output_dir)
+        st = exe.stat()
+        os.utime(exe, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self._process(output_dir)
+        assert renders == ["TestMod", "TestMod"]
+
+    def test_no_cache_always_renders(self, env):
+        """--no-cache should re-render even when nothing changed."""
+        _, _, output_dir, renders = env
+        self._process(output_dir, "--no-cache")
+        self._process(output_dir, "--no-cache")
+        assert renders == ["TestMod", "TestMod"]
+
+
+# =============================================================================
+# Test thread executor
+# =============================================================================
+
+class TestThreadedProcessing:
+    """process_module running side by side in threads (--executor thread)."""
+
+    MODULES = [f"Mod{i}" for i in range(8)]
+
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        """Fake renderer giving each module its own tone."""
+        pytest.importorskip("matplotlib")
+        pytest.importorskip("scipy")
+        import generate_unified_report
+        from scipy.io import wavfile
+
+        def fake_render(module_name, output_path, verbose=False):
+            freq = 220 * (1 + self.MODULES.index(module_name))
+            t = np.arange(24000) / 48000
+            wavfile.write(output_path, 48000, (0.5 * np.sin(2 * np.pi * freq * t)).astype(np.float32))
+            return True
+
+        monkeypatch.setattr(generate_unified_report, "render_showcase", fake_render)
+        monkeypatch.setattr(generate_unified_report, "get_module_params", lambda name: [])
+        monkeypatch.setattr(generate_unified_report, "showcase_cache_key", lambda name: None)
+        return tmp_path
+
+    def _run(self, output_dir, workers):
+        from concurrent.futures import ThreadPoolExecutor
+        from generate_unified_report import parse_args, process_module
+        config = parse_args(["--no-clap", "--executor", "thread"])
+        output_dir.mkdir()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(
+                lambda m: process_module(m, output_dir, config, {"module_type": "filter"}),
+                self.MODULES))
+        return {r.module_name: r for r in reports}
+
+    def test_concurrent_plots_match_sequential(self, env):
+        """Threads must not share figures: every plot should match a one-thread run."""
+        sequential = self._run(env / "seq", 1)
+        threaded = self._run(env / "thr", len(self.MODULES))
+        for name in self.MODULES:
+            for attr in ("spectrogram", "automation_graph"):
+                seq_path = getattr(sequential[name], attr)
+                thr_path = getattr(threaded[name], attr)
+                assert seq_path is not None and thr_path is not None, (name, attr)
+                assert thr_path.read_bytes() == seq_path.read_bytes(), (name, attr)
+
+
 # =============================================================================
 # Test HTML generation helpers
 # =============================================================================
@@ -383,49 +653,69 @@ class TestHTMLGeneration:
     """Tests for HTML generation helper functions."""
 
     def test_status_badge_pass(self):
-        """Pass status should be green."""
+        """Pass status should use the green pass class."""
         from generate_unified_report import get_status_badge
         html = get_status_badge("pass")
-        assert "#28a745" in html  # Green color
+        assert 'class="status-badge pass"' in html
         assert "PASS" in html
 
     def test_status_badge_needs_work(self):
-        """Needs work status should be yellow."""
+        """Needs work status should use the yellow needs-work class."""
         from generate_unified_report import get_status_badge
         html = get_status_badge("needs_work")
-        assert "#ffc107" in html  # Yellow color
+        assert 'class="status-badge needs-work"' in html
         assert "NEEDS WORK" in html
 
     def test_status_badge_skip(self):
-        """Skip status should be gray."""
+        """Skip status should use the gray skip class."""
         from generate_unified_report import get_status_badge
         html = get_status_badge("skip")
-        assert "#6c757d" in html  # Gray color
+        assert 'class="status-badge skip"' in html
         assert "SKIP" in html
 
     def test_metric_badge_good_higher_better(self):
         """Good value should be green when higher is better."""
         from generate_unified_report import get_metric_badge
         html = get_metric_badge(0.8, 0.5, 0.2, "", higher_is_better=True)
-        assert "#28a745" in html  # Green
+        assert 'class="metric-good"' in html
+
+    def test_metric_badge_warn_higher_better(self):
+        """Value between thresholds should be a warning when higher is better."""
+        from generate_unified_report import get_metric_badge
+        html = get_metric_badge(0.3, 0.5, 0.2, "", higher_is_better=True)
+        assert 'class="metric-warn"' in html
 
     def test_metric_badge_bad_higher_better(self):
         """Bad value should be red when higher is better."""
         from generate_unified_report import get_metric_badge
         html = get_metric_badge(0.1, 0.5, 0.2, "", higher_is_better=True)
-        assert "#dc3545" in html  # Red
+        assert 'class="metric-bad"' in html
 
     def test_metric_badge_good_lower_better(self):
         """Good value should be green when lower is better."""
         from generate_unified_report import get_metric_badge
         html = get_metric_badge(0.5, 1.0, 5.0, "%", higher_is_better=False)
-        assert "#28a745" in html  # Green
+        assert 'class="metric-good"' in html
 
     def test_metric_badge_bad_lower_better(self):
         """Bad value should be red when lower is better."""
         from generate_unified_report import get_metric_badge
         html = get_metric_badge(10.0, 1.0, 5.0, "%", higher_is_better=False)
-        assert "#dc3545" in html  # Red
+        assert 'class="metric-bad"' in html
+
+    def test_badge_classes_defined_in_css(self):
+        """Every class a badge can emit should have a rule in the report CSS."""
+        import re
+        from generate_unified_report import (
+            _REPORT_CSS, get_metric_badge, get_status_badge,
+        )
+        badges = [get_status_badge(s) for s in
+                  ("pass", "needs_work", "skip", "pending", "error")]
+        badges += [get_metric_badge(v, 0.5, 0.2) for v in (0.8, 0.3, 0.1)]
+        for badge in badges:
+            classes = re.search(r'class="([^"]+)"', badge).group(1).split()
+            selector = "." + ".".join(classes)
+            assert re.search(re.escape(selector) + r"\s*[{,]", _REPORT_CSS), selector
 
 
 # =============================================================================
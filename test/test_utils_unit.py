@@ -6,6 +6,7 @@ Tests the shared utility functions used across verification scripts.
 """
 
 import json
+import sys
 import tempfile
 from pathlib import Path
 from unittest import mock
@@ -18,10 +19,15 @@ from utils import (
     get_project_root,
     load_module_config,
     extract_audio_stats,
+    fused_audio_stats,
     db_to_linear,
     linear_to_db,
     _camel_to_snake,
     extract_module_description,
+    iter_render_audio_batch,
+    load_audio,
+    get_module_params,
+    _query_module_params,
     DEFAULT_QUALITY_THRESHOLDS,
 )
 
@@ -294,6 +300,181 @@ process = + : _;
         assert "No description" in desc
 
 
+# =============================================================================
+# Audio Loading Tests
+# =============================================================================
+
+class TestLoadAudio:
+    """Tests for load_audio()."""
+
+    @pytest.mark.parametrize("rate,dtype", [
+        (48000, np.float32),  # memory-mapped fast path
+        (48000, np.int16),
+        (48000, np.uint8),    # needs a full decoder
+        (24000, np.float32),  # needs resampling
+    ])
+    def test_stereo_is_samples_by_channels(self, rate, dtype):
+        """mono=False should return (samples, channels) whichever path loads it."""
+        from scipy.io import wavfile
+
+        left = np.linspace(-0.5, 0.5, rate // 10, dtype=np.float32)
+        stereo = np.stack([left, np.zeros_like(left)], axis=1)
+        if dtype == np.int16:
+            stereo = (stereo * 32767).astype(np.int16)
+        elif dtype == np.uint8:
+            stereo = (stereo * 127 + 128).astype(np.uint8)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stereo.wav"
+            wavfile.write(path, rate, stereo)
+            audio = load_audio(path, sr=48000, mono=False)
+
+        assert audio.ndim == 2
+        assert audio.shape[1] == 2
+        assert np.abs(audio[:, 0]).max() > 0.25
+        assert np.abs(audio[:, 1]).max() < 0.05
+
+    def test_mono_mixes_down(self):
+        """mono=True should return a 1D array."""
+        from scipy.io import wavfile
+
+        stereo = np.full((4800, 2), 0.25, dtype=np.float32)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stereo.wav"
+            wavfile.write(path, 48000, stereo)
+            audio = load_audio(path)
+
+        assert audio.shape == (4800,)
+
+
+class TestFusedAudioStats:
+    """Tests for fused_audio_stats()."""
+
+    AUDIO = np.array([0.5, -1.0, 0.25, 0.995, -0.1], dtype=np.float32)
+
+    def _check(self, stats):
+        total, sum_sq, peak, clip_count = stats
+        assert total == pytest.approx(float(self.AUDIO.sum()), abs=1e-6)
+        assert sum_sq == pytest.approx(float(np.dot(self.AUDIO, self.AUDIO)), abs=1e-6)
+        assert peak == pytest.approx(1.0)
+        assert clip_count == 2
+
+    def test_stats(self):
+        """Should match the equivalent NumPy reductions."""
+        self._check(fused_audio_stats(self.AUDIO))
+
+    def test_numpy_fallback(self):
+        """Should give the same stats without numba."""
+        with mock.patch('utils._stats_kernel', False):
+            self._check(fused_audio_stats(self.AUDIO))
+
+    def test_kernel_failure_falls_back(self):
+        """A numba error on first call should switch to the NumPy path."""
+        def broken_kernel(audio):
+            raise RuntimeError("numba typing error")
+
+        with mock.patch('utils._stats_kernel', broken_kernel):
+            self._check(fused_audio_stats(self.AUDIO))
+            import utils
+            assert utils._stats_kernel is False
+
+
+# =============================================================================
+# Batch Rendering Tests
+# =============================================================================
+
+class TestIterRenderAudioBatch:
+    """Tests for iter_render_audio_batch()."""
+
+    # Stands in for faust_render --batch: copies the batch file next to
+    # itself and reports even jobs as rendered, odd ones as failed
+    FAKE_RENDERER = """
+import json, shutil, sys
+from pathlib import Path
+batch = sys.argv[sys.argv.index("--batch") + 1]
+shutil.copy(batch, Path(__file__).with_name("batch.json"))
+for i, _ in enumerate(json.loads(Path(batch).read_text())):
+    print(("FAIL " if i % 2 else "OK ") + str(i), flush=True)
+"""
+
+    def _fake_renderer(self, tmpdir):
+        exe = Path(tmpdir) / "faust_render"
+        exe.write_text(f"#!{sys.executable}\n{self.FAKE_RENDERER}")
+        exe.chmod(0o755)
+        return exe
+
+    def test_empty_batch_yields_nothing(self):
+        """Should not report anything for an empty job list."""
+        assert list(iter_render_audio_batch("LadderLPF", [])) == []
+
+    def test_reports_each_job(self):
+        """Should pass every job in one batch file and report each job once."""
+        jobs = [
+            ({"cutoff": 0.1}, Path("/tmp/a.wav")),
+            ({"cutoff": 0.9}, Path("/tmp/b.wav")),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exe = self._fake_renderer(tmpdir)
+            with mock.patch('utils.get_render_executable', return_value=exe):
+                reported = list(iter_render_audio_batch("LadderLPF", jobs))
+            written = json.loads((Path(tmpdir) / "batch.json").read_text())
+
+        assert reported == [(0, True), (1, False)]
+        assert written == [
+            {"output": "/tmp/a.wav", "params": {"cutoff": 0.1}},
+            {"output": "/tmp/b.wav", "params": {"cutoff": 0.9}},
+        ]
+
+    def test_missing_renderer_fails_all_jobs(self):
+        """Should report every job as failed if faust_render is missing."""
+        jobs = [({}, Path("/tmp/a.wav")), ({}, Path("/tmp/b.wav"))]
+        with mock.patch('utils.get_render_executable',
+                        return_value=Path("/nonexistent/faust_render")):
+            assert list(iter_render_audio_batch("LadderLPF", jobs)) == [(0, False), (1, False)]
+
+
+# =============================================================================
+# Parameter Cache Tests
+# =============================================================================
+
+class TestModuleParamCache:
+    """Tests for the persistent get_module_params() cache."""
+
+    LIST_PARAMS_OUTPUT = (
+        "Parameters for TestModule:\n"
+        "  [0] /TestModule/cutoff (min=20, max=20000, init=1000)\n"
+    )
+
+    def _query(self, tmpdir, stamp):
+        """Call get_module_params() as a fresh process would."""
+        _query_module_params.cache_clear()
+        with mock.patch('utils.PARAM_CACHE_PATH', Path(tmpdir) / ".param_cache.json"), \
+                mock.patch('utils._renderer_stamp', return_value=stamp), \
+                mock.patch('utils.run_faust_render',
+                           return_value=(True, self.LIST_PARAMS_OUTPUT)) as mock_run:
+            params = get_module_params("TestModule")
+        _query_module_params.cache_clear()
+        return params, mock_run.call_count
+
+    def test_reuses_params_across_processes(self):
+        """Should only query faust_render once for an unchanged renderer."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first, first_calls = self._query(tmpdir, "1:100")
+            second, second_calls = self._query(tmpdir, "1:100")
+
+        assert first == second
+        assert first[0]["name"] == "cutoff"
+        assert (first_calls, second_calls) == (1, 0)
+
+    def test_rebuilt_renderer_invalidates_cache(self):
+        """Should query faust_render again once the renderer changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._query(tmpdir, "1:100")
+            _, calls = self._query(tmpdir, "2:100")
+
+        assert calls == 1
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
@@ -6,8 +6,13 @@ This module consolidates common functions used across multiple test scripts
 to reduce code duplication and provide a consistent interface.
 """
 
+import functools
 import json
+import os
 import subprocess
+import tempfile
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +29,10 @@ except ImportError:
 SAMPLE_RATE = 48000
 DEFAULT_DURATION = 2.0
 
+# faust_render --list-params output, persisted across runs; invalidated
+# whenever the renderer binary changes
+PARAM_CACHE_PATH = Path(__file__).parent / "output" / ".param_cache.json"
+
 # Default quality thresholds
 DEFAULT_QUALITY_THRESHOLDS = {
     "thd_max_percent": 15.0,
@@ -103,10 +112,60 @@ def get_module_params(module_name: str) -> list[dict[str, Any]]:
     Get parameter info for a module.
 
     Returns list of dicts with keys: index, name, path, min, max, init
+
+    The faust_render query is made once per module per renderer build
+    (cached in memory and in PARAM_CACHE_PATH); callers get fresh copies
+    they are free to modify.
     """
+    return [dict(p) for p in _query_module_params(module_name)]
+
+
+def _renderer_stamp() -> str | None:
+    """Identify the current faust_render build by its mtime and size."""
+    try:
+        st = get_render_executable().stat()
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _load_param_cache(stamp: str) -> dict[str, list[dict[str, Any]]]:
+    """Cached parameter lists by module, if recorded for this renderer build."""
+    try:
+        data = json.loads(PARAM_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("renderer") != stamp:
+        return {}
+    return data.get("modules", {})
+
+
+def _save_param_cache(stamp: str, module_name: str, params: list[dict[str, Any]]):
+    """Add a module's parameter list to the cache file (best effort)."""
+    modules = _load_param_cache(stamp)
+    modules[module_name] = params
+    # Write-then-rename, so concurrent workers never see a partial file
+    tmp_path = PARAM_CACHE_PATH.with_name(f"{PARAM_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        PARAM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps({"renderer": stamp, "modules": modules}))
+        os.replace(tmp_path, PARAM_CACHE_PATH)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=256)
+def _query_module_params(module_name: str) -> tuple[dict[str, Any], ...]:
+    """Query and parse a module's parameter list (cached per module)."""
+    stamp = _renderer_stamp()
+    if stamp is not None:
+        cached = _load_param_cache(stamp).get(module_name)
+        if cached is not None:
+            return tuple(cached)
+
     success, output = run_faust_render(["--module", module_name, "--list-params"])
     if not success:
-        return []
+        return ()
 
     params = []
     for line in output.strip().split("\n"):
@@ -141,7 +200,9 @@ def get_module_params(module_name: str) -> list[dict[str, Any]]:
             except (ValueError, IndexError):
                 continue
 
-    return params
+    if params and stamp is not None:
+        _save_param_cache(stamp, module_name, params)
+    return tuple(params)
 
 
 def render_audio(
@@ -182,6 +243,84 @@ def render_audio(
     return run_faust_render(args)
 
 
+def iter_render_audio_batch(
+    module_name: str,
+    jobs: list[tuple[dict[str, float], Path]],
+    duration: float = DEFAULT_DURATION,
+    sample_rate: int = SAMPLE_RATE,
+    no_auto_gate: bool = False,
+) -> Iterator[tuple[int, bool]]:
+    """
+    Render several parameter sets for a module in one faust_render process.
+
+    Args:
+        module_name: Name of the Faust module
+        jobs: (params, output_path) pairs, one WAV file per pair
+        duration: Duration of each render in seconds
+        sample_rate: Sample rate in Hz
+        no_auto_gate: If True, don't auto-trigger gate
+
+    Yields:
+        (job index, success) as faust_render finishes each job, so a caller
+        can process one WAV while the next renders. Every job is reported
+        exactly once; jobs the renderer never reported (crash, timeout)
+        come last, as failures.
+    """
+    reported = [False] * len(jobs)
+    exe = get_render_executable()
+
+    if jobs and exe.exists():
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", encoding="utf-8", delete=False
+        ) as f:
+            json.dump(
+                [{"output": str(path), "params": params} for params, path in jobs],
+                f, ensure_ascii=False,
+            )
+            batch_path = Path(f.name)
+
+        cmd = [
+            str(exe),
+            "--module", module_name,
+            "--batch", str(batch_path),
+            "--duration", str(duration),
+            "--sample-rate", str(sample_rate),
+        ]
+
+        if no_auto_gate:
+            cmd.append("--no-auto-gate")
+
+        try:
+            with subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ) as proc:
+                # Same per-render time budget as render_audio
+                timer = threading.Timer(60 * len(jobs), proc.kill)
+                timer.start()
+                try:
+                    # One "OK <index>" / "FAIL <index>" line per job
+                    for line in proc.stdout:
+                        status, _, index = line.strip().partition(" ")
+                        if status not in ("OK", "FAIL") or not index.isdigit():
+                            continue
+                        i = int(index)
+                        if i < len(jobs) and not reported[i]:
+                            reported[i] = True
+                            yield i, status == "OK"
+                finally:
+                    timer.cancel()
+                    if proc.poll() is None:
+                        proc.kill()
+        except OSError:
+            pass
+        finally:
+            batch_path.unlink(missing_ok=True)
+
+    for i, done in enumerate(reported):
+        if not done:
+            yield i, False
+
+
 # =============================================================================
 # Audio loading utilities
 # =============================================================================
@@ -196,12 +335,23 @@ def load_audio(path: Path, sr: int = SAMPLE_RATE, mono: bool = True) -> np.ndarr
         mono: If True, convert to mono
 
     Returns:
-        Audio samples as numpy array, or None on failure
+        Audio samples as numpy array, or None on failure. Multichannel
+        audio (mono=False) is shaped (samples, channels) on every path.
     """
+    # Fast path: a WAV already at the target rate needs no decoding or
+    # resampling, so memory-map it and convert to float32 in one step
+    try:
+        data = _load_wav_mmap(path, sr, mono)
+        if data is not None:
+            return data
+    except Exception:
+        pass
+
     if HAS_LIBROSA:
         try:
             y, _ = librosa.load(str(path), sr=sr, mono=mono)
-            return y
+            # librosa returns (channels, samples); match the scipy layout
+            return y.T if y.ndim > 1 else y
         except Exception:
             pass
 
@@ -220,6 +370,33 @@ def load_audio(path: Path, sr: int = SAMPLE_RATE, mono: bool = True) -> np.ndarr
         return None
 
 
+def _load_wav_mmap(path: Path, sr: int, mono: bool) -> np.ndarray | None:
+    """
+    Read a WAV file through a memory map, without resampling.
+
+    Returns None if the file is not at the target sample rate or uses a
+    sample format that needs a full decoder.
+    """
+    from scipy.io import wavfile
+    file_sr, data = wavfile.read(str(path), mmap=True)
+    if file_sr != sr:
+        return None
+
+    if data.dtype == np.float32:
+        # Copy-on-write view onto the mapped file, no copy
+        data = np.asarray(data)
+    elif data.dtype == np.int16:
+        data = np.multiply(data, np.float32(1.0 / 32768.0), dtype=np.float32)
+    elif data.dtype == np.int32:
+        data = np.multiply(data, np.float32(1.0 / 2147483648.0), dtype=np.float32)
+    else:
+        return None
+
+    if mono and data.ndim > 1:
+        data = data.mean(axis=1, dtype=np.float32)
+    return data
+
+
 # =============================================================================
 # Module configuration utilities
 # =============================================================================
@@ -391,6 +568,80 @@ def extract_audio_stats(audio: np.ndarray, clipping_threshold: float = 0.99) ->
     }
 
 
+# Samples at or above this magnitude count as clipped in fused_audio_stats
+CLIP_LEVEL = 0.99
+# Block size for the NumPy stats fallback (256 KiB of float32)
+STATS_BLOCK = 1 << 16
+
+
+def _fused_stats_kernel(audio):
+    """Sum, sum of squares, peak and clip count accumulated in one loop."""
+    total = 0.0
+    sum_sq = 0.0
+    peak = 0.0
+    clip_count = 0
+    for x in audio:
+        total += x
+        sum_sq += x * x
+        mag = abs(x)
+        if mag > peak:
+            peak = mag
+        if mag >= CLIP_LEVEL:
+            clip_count += 1
+    return total, sum_sq, peak, clip_count
+
+
+def _fused_stats_numpy(audio: np.ndarray) -> tuple[float, float, float, int]:
+    """NumPy fallback for fused_audio_stats.
+
+    Works through the buffer in STATS_BLOCK-sample blocks with one reused
+    abs buffer, so temporaries stay constant-size however long the audio.
+    """
+    total = 0.0
+    sum_sq = 0.0
+    peak = 0.0
+    clip_count = 0
+    abs_buf = np.empty(min(len(audio), STATS_BLOCK), dtype=audio.dtype)
+    for start in range(0, len(audio), STATS_BLOCK):
+        block = audio[start:start + STATS_BLOCK]
+        mag = abs_buf[:len(block)]
+        np.abs(block, out=mag)
+        total += float(np.sum(block))
+        sum_sq += float(np.einsum('i,i->', block, block))
+        peak = max(peak, float(mag.max()))
+        clip_count += int(np.count_nonzero(mag >= CLIP_LEVEL))
+    return total, sum_sq, peak, clip_count
+
+
+# numba-compiled _fused_stats_kernel; None until first use, False once numba
+# is missing or has failed to compile it
+_stats_kernel = None
+
+
+def fused_audio_stats(audio: np.ndarray) -> tuple[float, float, float, int]:
+    """
+    Return (sum, sum_sq, peak, clip_count) for a contiguous 1-D buffer.
+
+    Uses a numba kernel when numba is installed. numba compiles lazily, on
+    the first call for each dtype, so typing or compile errors only show up
+    when the kernel runs; any such error switches this process over to the
+    NumPy fallback for good.
+    """
+    global _stats_kernel
+    if _stats_kernel is None:
+        try:
+            from numba import njit
+            _stats_kernel = njit(fastmath=True)(_fused_stats_kernel)
+        except Exception:
+            _stats_kernel = False
+    if _stats_kernel:
+        try:
+            return _stats_kernel(audio)
+        except Exception:
+            _stats_kernel = False
+    return _fused_stats_numpy(audio)
+
+
 # =============================================================================
 # Report generation utilities
 # =============================================================================